@@ -1,24 +1,34 @@
-"""Command-line interface for half-america."""
+"""Command-line interface for half-america.
 
+Pipeline modules (geopandas, shapely, PyMaxflow, ...) are imported inside
+each command so that ``--help`` and argument errors stay fast.
+"""
+
+import math
 from pathlib import Path
 
 import click
 
-from half_america.config import TOPOJSON_DIR
-from half_america.data.cache import get_sweep_cache_path
-from half_america.data.pipeline import load_all_tracts
-from half_america.graph.pipeline import load_graph_data
-from half_america.optimization import (
-    save_sweep_result,
-    sweep_lambda,
-)
-from half_america.optimization.sweep import load_sweep_result
-from half_america.postprocess import (
-    dissolve_all_lambdas,
-    export_all_lambdas,
-    export_combined_topojson,
-    simplify_all_lambdas,
-)
+from half_america.config import MAX_WORKERS, TOPOJSON_DIR
+
+
+def lambda_grid(lambda_step: float, lambda_max: float) -> list[float]:
+    """
+    Generate lambda values from 0.0 up to but not including lambda_max.
+
+    The grid is built from an integer step count rather than float
+    accumulation, so lambda_max is never included through rounding error
+    (np.arange(0.0, 0.9, 0.03) ends at 0.9).
+
+    Args:
+        lambda_step: Lambda increment
+        lambda_max: Exclusive upper bound
+
+    Returns:
+        Lambda values rounded to two decimals
+    """
+    num_values = math.ceil(round(lambda_max / lambda_step, 9))
+    return [round(i * lambda_step, 2) for i in range(num_values)]
 
 
 @click.group()
@@ -50,10 +60,30 @@ def cli() -> None:
     is_flag=True,
     help="Continue sweep even if some lambda values fail to converge",
 )
+@click.option(
+    "--warm-start",
+    is_flag=True,
+    help="Solve lambdas in order, seeding each mu search (fewer iterations, serial)",
+)
 def precompute(
-    force: bool, lambda_step: float, lambda_max: float, skip_failures: bool
+    force: bool,
+    lambda_step: float,
+    lambda_max: float,
+    skip_failures: bool,
+    warm_start: bool,
 ) -> None:
     """Pre-compute optimization results for all lambda values."""
+    from half_america.data.cache import find_sweep_cache_paths, get_sweep_cache_path
+    from half_america.data.pipeline import load_all_tracts
+    from half_america.graph.pipeline import get_graph_fingerprint, load_graph_data
+    from half_america.optimization import (
+        TARGET_TOLERANCE,
+        LambdaResult,
+        load_sweep_result,
+        save_sweep_result,
+        sweep_lambda,
+    )
+
     cache_path = get_sweep_cache_path(lambda_step)
 
     if cache_path.exists() and not force:
@@ -67,15 +97,43 @@ def precompute(
     click.echo("Building graph data...")
     graph_data = load_graph_data(gdf)
 
-    # Generate lambda values from 0.0 up to but not including lambda_max
-    num_steps = int(lambda_max / lambda_step)
-    lambda_values = [round(i * lambda_step, 2) for i in range(num_steps)]
+    lambda_values = lambda_grid(lambda_step, lambda_max)
+
+    # Reuse λ values already solved by sweeps with other step sizes, as long
+    # as they searched the same graph for the same target
+    target_fraction, tolerance = 0.5, TARGET_TOLERANCE
+    initial_results: dict[float, LambdaResult] = {}
+    if not force:
+        requested = set(lambda_values)
+        search_key = (get_graph_fingerprint(graph_data), target_fraction, tolerance)
+        for path in find_sweep_cache_paths():
+            cached = load_sweep_result(path)
+            cached_key = (
+                cached.graph_fingerprint,
+                cached.target_fraction,
+                cached.tolerance,
+            )
+            if cached_key != search_key:
+                continue
+            for lam, lam_result in cached.results.items():
+                if lam in requested:
+                    initial_results.setdefault(lam, lam_result)
+        if initial_results:
+            click.echo(
+                f"Reusing {len(initial_results)} lambda values from existing caches"
+            )
+
     click.echo(f"Running sweep for {len(lambda_values)} lambda values...")
 
     result = sweep_lambda(
         graph_data,
         lambda_values=lambda_values,
+        target_fraction=target_fraction,
+        tolerance=tolerance,
+        max_workers=MAX_WORKERS,
         raise_on_failure=not skip_failures,
+        initial_results=initial_results,
+        warm_start=warm_start,
     )
 
     save_sweep_result(result, cache_path)
@@ -112,6 +170,21 @@ def export(
     force: bool,
 ) -> None:
     """Export post-processed geometries as TopoJSON for web delivery."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from half_america.data.cache import get_sweep_cache_path
+    from half_america.data.pipeline import load_all_tracts
+    from half_america.optimization.sweep import load_sweep_result
+    from half_america.postprocess import (
+        DissolveResult,
+        ExportResult,
+        SimplifyResult,
+        dissolve_lambda,
+        export_combined_topojson,
+        export_lambda,
+        simplify_geometry,
+    )
+
     # Resolve output directory
     if output_dir is None:
         output_dir = TOPOJSON_DIR
@@ -135,22 +208,43 @@ def export(
     click.echo("Loading tract data...")
     gdf = load_all_tracts()
 
-    # Run postprocessing pipeline
-    click.echo("Dissolving partitions...")
-    dissolve_results = dissolve_all_lambdas(gdf, sweep_result, verbose=False)
-
-    click.echo("Simplifying geometries...")
-    simplify_results = simplify_all_lambdas(dissolve_results, verbose=False)
-
-    # Export to TopoJSON
-    click.echo(f"Exporting TopoJSON to {output_dir}...")
-    export_results = export_all_lambdas(
-        simplify_results,
-        dissolve_results,
-        sweep_result,
-        output_dir=output_dir,
-        verbose=True,
-    )
+    # Run postprocessing pipeline. Each lambda is independent and Shapely
+    # releases the GIL, so dissolve → simplify → export runs per lambda in
+    # a thread pool (no pickling of the tract GeoDataFrame).
+    def process_lambda(
+        lambda_val: float,
+    ) -> tuple[DissolveResult, SimplifyResult, ExportResult]:
+        dissolve_result = dissolve_lambda(gdf, sweep_result, lambda_val)
+        simplify_result = simplify_geometry(dissolve_result.geometry)
+        export_result = export_lambda(
+            lambda_val,
+            simplify_result,
+            dissolve_result,
+            sweep_result,
+            output_dir=output_dir,
+        )
+        return dissolve_result, simplify_result, export_result
+
+    lambda_values = sweep_result.lambda_values
+    click.echo(f"Processing {len(lambda_values)} lambda values into {output_dir}...")
+
+    dissolve_results: dict[float, DissolveResult] = {}
+    simplify_results: dict[float, SimplifyResult] = {}
+    export_results: dict[float, ExportResult] = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        outputs = executor.map(process_lambda, lambda_values)
+        for lambda_val, (dissolved, simplified, exported) in zip(
+            lambda_values, outputs
+        ):
+            dissolve_results[lambda_val] = dissolved
+            simplify_results[lambda_val] = simplified
+            export_results[lambda_val] = exported
+            size_kb = exported.file_size_bytes / 1024
+            click.echo(
+                f"  λ={lambda_val:.2f}: {dissolved.num_tracts:,} tracts → "
+                f"{exported.path.name} ({size_kb:.1f} KB)"
+            )
 
     # Optionally create combined file
     if combined:
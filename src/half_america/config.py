@@ -1,6 +1,7 @@
 """Central configuration for Half of America."""
 
 import os
+import warnings
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -24,6 +25,28 @@ TOPOJSON_DIR = OUTPUT_DIR / "topojson"
 # Census API configuration
 CENSUS_API_KEY = os.getenv("CENSUS_API_KEY")
 
+
+def _parse_workers(value: str | None) -> int | None:
+    """Parse HALF_AMERICA_WORKERS, ignoring malformed or non-positive values."""
+    if not value:
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        warnings.warn(
+            f"Ignoring HALF_AMERICA_WORKERS={value!r}: expected a positive "
+            "integer; using the executor default",
+            stacklevel=2,
+        )
+        return None
+    return workers
+
+
+# Worker count for parallel loading and solving (None = executor default)
+MAX_WORKERS: int | None = _parse_workers(os.getenv("HALF_AMERICA_WORKERS"))
+
 # Data year configuration (locked versions)
 TIGER_YEAR = 2024
 ACS_YEAR = 2022
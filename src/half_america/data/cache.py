@@ -4,6 +4,11 @@ from pathlib import Path
 
 from half_america.config import CENSUS_DIR, PROCESSED_DIR, TIGER_DIR
 
+# Version of the processed tract schema (kept TIGER columns and cleaning
+# defaults). Bump it whenever either changes, so processed caches written
+# by older code are rebuilt instead of silently reused.
+PROCESSED_SCHEMA_VERSION = 2
+
 
 def ensure_cache_dirs() -> None:
     """Create cache directories if they don't exist."""
@@ -27,6 +32,22 @@ def get_processed_cache_path(name: str) -> Path:
     return PROCESSED_DIR / f"{name}.parquet"
 
 
+def get_processed_state_cache_path(state_fips: str) -> Path:
+    """Get cache path for a state's cleaned tracts joined with population.
+
+    Args:
+        state_fips: Two-digit FIPS code for the state
+
+    Returns:
+        Path like data/cache/processed/state_11_2024_2022_v2.parquet
+    """
+    from half_america.config import ACS_YEAR, TIGER_YEAR
+
+    return get_processed_cache_path(
+        f"state_{state_fips}_{TIGER_YEAR}_{ACS_YEAR}_v{PROCESSED_SCHEMA_VERSION}"
+    )
+
+
 def get_sweep_cache_path(lambda_step: float = 0.1) -> Path:
     """Get cache path for sweep results.
 
@@ -34,8 +55,19 @@ def get_sweep_cache_path(lambda_step: float = 0.1) -> Path:
         lambda_step: Lambda increment used in sweep (default 0.1)
 
     Returns:
-        Path like data/cache/processed/sweep_2024_2022_0.1.pkl
+        Path like data/cache/processed/sweep_2024_2022_0.1.feather
+    """
+    from half_america.config import ACS_YEAR, TIGER_YEAR
+
+    return PROCESSED_DIR / f"sweep_{TIGER_YEAR}_{ACS_YEAR}_{lambda_step}.feather"
+
+
+def find_sweep_cache_paths() -> list[Path]:
+    """Find existing sweep caches for the configured data vintage.
+
+    Returns:
+        Sorted paths of sweep caches with any lambda step
     """
     from half_america.config import ACS_YEAR, TIGER_YEAR
 
-    return PROCESSED_DIR / f"sweep_{TIGER_YEAR}_{ACS_YEAR}_{lambda_step}.pkl"
+    return sorted(PROCESSED_DIR.glob(f"sweep_{TIGER_YEAR}_{ACS_YEAR}_*.feather"))
@@ -1,27 +1,49 @@
 """Census API population data fetching."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
-import cenpy
 import pandas as pd
+import requests
 import requests_cache
 
-from half_america.config import ACS_YEAR, CACHE_DIR
+from half_america.config import ACS_YEAR, CACHE_DIR, CENSUS_API_KEY
 from half_america.data.cache import ensure_cache_dirs, get_census_cache_path
 from half_america.data.constants import CONTIGUOUS_US_FIPS, FIPS_TO_STATE
+from half_america.data.frames import concat_frames
+
+# ACS 5-Year detailed tables endpoint
+CENSUS_API_URL = "https://api.census.gov/data/{year}/acs/acs5"
+
+# Seconds to wait for a Census API response
+REQUEST_TIMEOUT = 60
+
+# Worker threads for fetching states concurrently (requests are I/O-bound)
+FETCH_WORKERS = 16
+
+# Maximum simultaneous Census API requests, to stay within rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+_cache_lock = threading.Lock()
 
 
 def _setup_requests_cache() -> None:
-    """Install requests-cache for Census API calls."""
-    cache_path = CACHE_DIR / "requests_cache"
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-    requests_cache.install_cache(
-        str(cache_path),
-        backend="sqlite",
-        expire_after=timedelta(days=30),
-        stale_if_error=True,
-    )
+    """Install requests-cache for Census API calls (idempotent, thread-safe)."""
+    with _cache_lock:
+        if requests_cache.is_installed():
+            return
+
+        cache_path = CACHE_DIR / "requests_cache"
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        requests_cache.install_cache(
+            str(cache_path),
+            backend="sqlite",
+            expire_after=timedelta(days=30),
+            stale_if_error=True,
+        )
 
 
 def fetch_state_population(
@@ -53,19 +75,27 @@ def fetch_state_population(
     state_name = FIPS_TO_STATE.get(state_fips, state_fips)
     print(f"Fetching ACS population for {state_name} ({state_fips})...")
 
-    # Connect to ACS 5-Year API
-    conn = cenpy.remote.APIConnection(f"ACSDT5Y{year}")
-
-    # Query tract-level population
+    # Query tract-level population in a single request per state
     # B01003_001E = Total Population
-    data = conn.query(
-        cols=["NAME", "B01003_001E", "GEO_ID"],
-        geo_unit="tract:*",
-        geo_filter={"state": state_fips, "county": "*"},
-    )
-
-    # Process results
-    df = pd.DataFrame(data)
+    params = {
+        "get": "NAME,B01003_001E,GEO_ID",
+        "for": "tract:*",
+        "in": f"state:{state_fips}",
+    }
+    if CENSUS_API_KEY:
+        params["key"] = CENSUS_API_KEY
+
+    with _request_slots:
+        response = requests.get(
+            CENSUS_API_URL.format(year=year),
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
+    response.raise_for_status()
+
+    # Process results (first row is the header)
+    rows = response.json()
+    df = pd.DataFrame(rows[1:], columns=rows[0])
 
     # Convert population to numeric (API returns strings)
     df["population"] = (
@@ -73,8 +103,9 @@ def fetch_state_population(
     )
 
     # Create GEOID for joining with TIGER data
-    # GEOID format: state (2) + county (3) + tract (6) = 11 digits
-    df["GEOID"] = df["state"] + df["county"] + df["tract"]
+    # GEOID format: state (2) + county (3) + tract (6) = 11 digits.
+    # The state is fixed per request, so only county + tract vary per row.
+    df["GEOID"] = state_fips + df["county"].str.cat(df["tract"])
 
     # Keep only needed columns
     result = df[["GEOID", "population", "NAME"]].copy()
@@ -100,15 +131,21 @@ def fetch_all_population(
     Returns:
         DataFrame with GEOID and population for all tracts
     """
-    all_dfs: list[pd.DataFrame] = []
+    # Install the shared HTTP cache once before fanning out
+    _setup_requests_cache()
 
-    for fips in CONTIGUOUS_US_FIPS:
-        df = fetch_state_population(fips, year, force_fetch)
-        all_dfs.append(df)
+    # Each state is an independent HTTP round-trip; overlap the waits
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        all_dfs: list[pd.DataFrame] = list(
+            executor.map(
+                lambda fips: fetch_state_population(fips, year, force_fetch),
+                CONTIGUOUS_US_FIPS,
+            )
+        )
 
     # Concatenate all states
     print(f"Concatenating {len(all_dfs)} state population datasets...")
-    combined = pd.concat(all_dfs, ignore_index=True)
+    combined = concat_frames(all_dfs)
 
     print(f"Total tracts with population: {len(combined)}")
     print(f"Total US population: {combined['population'].sum():,}")
@@ -3,6 +3,7 @@
 from typing import NamedTuple
 
 import geopandas as gpd
+import numpy as np
 import shapely
 
 from half_america.data.constants import QUANTIZATION_GRID_SIZE, TARGET_CRS
@@ -45,8 +46,12 @@ def fix_invalid_geometries(gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, int
     invalid_mask = ~gdf.is_valid
     invalid_count = invalid_mask.sum()
 
+    # Only repair the invalid subset; make_valid is expensive and a no-op
+    # on geometries that are already valid
     if invalid_count > 0:
-        gdf["geometry"] = shapely.make_valid(gdf["geometry"])
+        gdf.loc[invalid_mask, "geometry"] = shapely.make_valid(
+            gdf.loc[invalid_mask, "geometry"].values
+        )
 
     return gdf, invalid_count
 
@@ -114,6 +119,7 @@ def add_area_column(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
 def clean_census_tracts(
     gdf: gpd.GeoDataFrame,
     verbose: bool = True,
+    normalize: bool = False,
 ) -> tuple[gpd.GeoDataFrame, CleaningStats]:
     """
     Complete geometry cleaning pipeline for Census Tracts.
@@ -123,12 +129,20 @@ def clean_census_tracts(
     2. Reproject to Albers Equal Area (EPSG:5070)
     3. Fix invalid geometries (make_valid)
     4. Quantize coordinates (close micro-gaps)
-    5. Normalize coordinate order
+    5. Normalize coordinate order (optional)
     6. Add area column
 
+    Normalization is off by default: nothing downstream compares geometries
+    for equality, and dissolve/simplify/TopoJSON export do not depend on
+    vertex order.
+
+    Steps 3-6 run as vectorized Shapely operations on a single geometry
+    array, and the output GeoDataFrame is assembled once at the end.
+
     Args:
         gdf: GeoDataFrame with tract geometries
         verbose: If True, print progress messages
+        normalize: If True, normalize coordinate order (default: False)
 
     Returns:
         Tuple of (cleaned GeoDataFrame, cleaning statistics)
@@ -139,30 +153,52 @@ def clean_census_tracts(
         print(f"Cleaning {input_count} tract geometries...")
 
     # 1. Remove null/empty geometries
-    gdf, null_removed = remove_null_geometries(gdf)
-    if verbose and null_removed > 0:
-        print(f"  Removed {null_removed} null/empty geometries")
+    geoms = np.asarray(gdf.geometry.values)
+    null_mask = shapely.is_missing(geoms) | shapely.is_empty(geoms)
+    null_removed = int(null_mask.sum())
+    if null_removed > 0:
+        gdf = gdf[~null_mask]
+        if verbose:
+            print(f"  Removed {null_removed} null/empty geometries")
 
     # 2. Reproject to equal area CRS
     gdf = reproject_to_equal_area(gdf)
     if verbose:
         print(f"  Reprojected to {TARGET_CRS}")
 
-    # 3. Fix invalid geometries
-    gdf, invalid_fixed = fix_invalid_geometries(gdf)
-    if verbose and invalid_fixed > 0:
-        print(f"  Fixed {invalid_fixed} invalid geometries")
+    # Work on a private copy of the geometry array (references only)
+    geoms = np.array(gdf.geometry.values, dtype=object)
 
-    # 4. Quantize coordinates
-    gdf, invalid_after_quantize = quantize_coordinates(gdf)
-    if verbose and invalid_after_quantize > 0:
-        print(f"  Re-fixed {invalid_after_quantize} geometries after quantization")
+    # 3. Fix invalid geometries
+    invalid_mask = ~shapely.is_valid(geoms)
+    invalid_fixed = int(invalid_mask.sum())
+    if invalid_fixed > 0:
+        geoms[invalid_mask] = shapely.make_valid(geoms[invalid_mask])
+        if verbose:
+            print(f"  Fixed {invalid_fixed} invalid geometries")
+
+    # 4. Quantize coordinates (can introduce new invalid geometries)
+    geoms = shapely.set_precision(geoms, grid_size=QUANTIZATION_GRID_SIZE)
+    invalid_mask = ~shapely.is_valid(geoms)
+    invalid_after_quantize = int(invalid_mask.sum())
+    if invalid_after_quantize > 0:
+        geoms[invalid_mask] = shapely.make_valid(geoms[invalid_mask])
+        if verbose:
+            print(f"  Re-fixed {invalid_after_quantize} geometries after quantization")
 
     # 5. Normalize coordinate order
-    gdf = normalize_geometries(gdf)
+    if normalize:
+        geoms = shapely.normalize(geoms)
 
     # 6. Add area column
-    gdf = add_area_column(gdf)
+    areas = shapely.area(geoms)
+
+    geometry_col = gdf.geometry.name
+    gdf = gpd.GeoDataFrame(
+        gdf.drop(columns=geometry_col),
+        geometry=gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs, name=geometry_col),
+    )
+    gdf["area_sqm"] = areas
     if verbose:
         print("  Added area_sqm column")
 
@@ -0,0 +1,70 @@
+"""DataFrame assembly utilities."""
+
+from collections.abc import Sequence
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+
+def concat_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate same-schema frames into preallocated column arrays.
+
+    Each column (including the geometry array) is allocated once at its
+    final length and filled by slice assignment, so row data is copied a
+    single time instead of going through pd.concat plus a GeoDataFrame wrap.
+    Frames whose columns or dtypes differ from the first (e.g. per-state
+    caches written by an older version) go through pd.concat instead, which
+    aligns columns and upcasts dtypes.
+
+    Args:
+        frames: Non-empty sequence of DataFrames or GeoDataFrames
+
+    Returns:
+        Concatenated frame with a fresh RangeIndex. GeoDataFrame inputs
+        produce a GeoDataFrame with the first frame's CRS.
+
+    Raises:
+        ValueError: If frames is empty
+    """
+    if not frames:
+        raise ValueError("No frames to concatenate")
+
+    first = frames[0]
+    is_geo = isinstance(first, gpd.GeoDataFrame)
+    geometry_col = first.geometry.name if is_geo else None
+
+    if not all(f.dtypes.equals(first.dtypes) for f in frames[1:]):
+        combined = pd.concat(frames, ignore_index=True)
+        if is_geo:
+            return gpd.GeoDataFrame(combined, geometry=geometry_col, crs=first.crs)
+        return combined
+
+    total = sum(len(f) for f in frames)
+
+    columns: dict[str, object] = {}
+    for col in first.columns:
+        if col == geometry_col:
+            out = np.empty(total, dtype=object)
+        else:
+            out = np.empty(total, dtype=first[col].to_numpy().dtype)
+
+        offset = 0
+        for f in frames:
+            n = len(f)
+            if col == geometry_col:
+                out[offset : offset + n] = np.asarray(f.geometry.values)
+            else:
+                out[offset : offset + n] = f[col].to_numpy()
+            offset += n
+
+        if col == geometry_col:
+            columns[col] = gpd.GeoSeries(out, crs=first.crs, name=col)
+        else:
+            # Restore extension dtypes (e.g. pyarrow-backed strings)
+            columns[col] = pd.Series(out, dtype=first[col].dtype, name=col, copy=False)
+
+    if is_geo:
+        return gpd.GeoDataFrame(columns, geometry=geometry_col, crs=first.crs)
+    return pd.DataFrame(columns)
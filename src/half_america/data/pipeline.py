@@ -1,13 +1,21 @@
 """Full data pipeline for loading and processing Census Tract data."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import geopandas as gpd
-import pandas as pd
 
-from half_america.config import ACS_YEAR, TIGER_YEAR
-from half_america.data.cache import ensure_cache_dirs, get_processed_cache_path
+from half_america.config import ACS_YEAR, MAX_WORKERS, TIGER_YEAR
+from half_america.data.cache import (
+    PROCESSED_SCHEMA_VERSION,
+    ensure_cache_dirs,
+    get_processed_cache_path,
+    get_processed_state_cache_path,
+)
 from half_america.data.census import fetch_state_population
 from half_america.data.cleaning import clean_census_tracts
 from half_america.data.constants import CONTIGUOUS_US_FIPS
+from half_america.data.frames import concat_frames
 from half_america.data.tiger import download_state_tracts
 
 
@@ -18,7 +26,8 @@ def load_state_tracts(
     """
     Load tract data for a single state with population.
 
-    Downloads geometry, fetches population, cleans, and joins.
+    Downloads geometry, fetches population, cleans, and joins. The joined
+    result is cached per state, so warm runs skip the GEOS cleaning work.
 
     Args:
         state_fips: Two-digit FIPS code
@@ -27,6 +36,13 @@ def load_state_tracts(
     Returns:
         GeoDataFrame with cleaned geometries and population
     """
+    ensure_cache_dirs()
+    cache_path = get_processed_state_cache_path(state_fips)
+
+    # Return processed state cache if available
+    if cache_path.exists() and not force_download:
+        return gpd.read_parquet(cache_path)
+
     # Download geometry
     gdf = download_state_tracts(state_fips, force_download=force_download)
 
@@ -42,6 +58,9 @@ def load_state_tracts(
     # Fill missing population with 0 (water-only tracts, etc.)
     gdf["population"] = gdf["population"].fillna(0).astype(int)
 
+    # Cache processed state result
+    gdf.to_parquet(cache_path, compression="zstd", compression_level=3)
+
     return gdf
 
 
@@ -60,32 +79,35 @@ def load_all_tracts(
         GeoDataFrame with all tracts, cleaned geometries, and population
     """
     ensure_cache_dirs()
-    cache_path = get_processed_cache_path(f"all_tracts_{TIGER_YEAR}_{ACS_YEAR}")
+    cache_path = get_processed_cache_path(
+        f"all_tracts_{TIGER_YEAR}_{ACS_YEAR}_v{PROCESSED_SCHEMA_VERSION}"
+    )
 
     # Return processed cache if available
     if use_cache and cache_path.exists() and not force_download:
         print(f"Loading cached processed data from {cache_path}")
-        return gpd.read_parquet(cache_path)
+        # Memory-map the file so Arrow decodes straight from the page cache
+        return gpd.read_parquet(cache_path, memory_map=True)
 
     print("Loading all contiguous US tract data...")
 
-    all_gdfs: list[gpd.GeoDataFrame] = []
-    total_population = 0
+    # States are independent; threads overlap network I/O and GEOS work
+    # (which releases the GIL) without pickling GeoDataFrames.
+    # executor.map preserves FIPS order so row indices stay deterministic.
+    load_state = partial(load_state_tracts, force_download=force_download)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        all_gdfs: list[gpd.GeoDataFrame] = list(
+            executor.map(load_state, CONTIGUOUS_US_FIPS)
+        )
 
-    for fips in CONTIGUOUS_US_FIPS:
-        gdf = load_state_tracts(fips, force_download=force_download)
-        all_gdfs.append(gdf)
-        total_population += gdf["population"].sum()
+    total_population = sum(int(gdf["population"].sum()) for gdf in all_gdfs)
 
     # Concatenate all states
     print(f"Concatenating {len(all_gdfs)} state datasets...")
-    combined = gpd.GeoDataFrame(
-        pd.concat(all_gdfs, ignore_index=True),
-        crs=all_gdfs[0].crs,
-    )
+    combined = concat_frames(all_gdfs)
 
     # Cache processed result
-    combined.to_parquet(cache_path)
+    combined.to_parquet(cache_path, compression="zstd", compression_level=3)
     print(f"Cached processed data to {cache_path}")
 
     print("\nSummary:")
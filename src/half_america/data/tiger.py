@@ -1,11 +1,56 @@
 """TIGER/Line shapefile download and caching."""
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import geopandas as gpd
-import pandas as pd
+import pyogrio
 
 from half_america.config import TIGER_YEAR
 from half_america.data.cache import ensure_cache_dirs, get_tiger_cache_path
 from half_america.data.constants import CONTIGUOUS_US_FIPS, FIPS_TO_STATE
+from half_america.data.frames import concat_frames
+
+# GDAL options for streaming shapefiles directly out of remote zip archives:
+# only probe .zip URLs, and multiplex HTTP/2 range requests on one connection.
+# Applied only while a download is reading, and only where neither the user
+# (environment) nor other code has already configured them.
+GDAL_HTTP_OPTIONS = {
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".zip",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+}
+
+# GDAL config options are process-wide, so concurrent downloads share one
+# application: the first reader sets them and the last one clears them
+_gdal_options_lock = threading.Lock()
+_gdal_options_readers = 0
+_gdal_options_applied: list[str] = []
+
+
+@contextmanager
+def _gdal_http_options() -> Iterator[None]:
+    """Apply GDAL_HTTP_OPTIONS for the duration of a remote read."""
+    global _gdal_options_readers, _gdal_options_applied
+
+    with _gdal_options_lock:
+        if _gdal_options_readers == 0:
+            _gdal_options_applied = [
+                key
+                for key in GDAL_HTTP_OPTIONS
+                if pyogrio.get_gdal_config_option(key) is None
+            ]
+            pyogrio.set_gdal_config_options(
+                {key: GDAL_HTTP_OPTIONS[key] for key in _gdal_options_applied}
+            )
+        _gdal_options_readers += 1
+    try:
+        yield
+    finally:
+        with _gdal_options_lock:
+            _gdal_options_readers -= 1
+            if _gdal_options_readers == 0:
+                pyogrio.set_gdal_config_options(dict.fromkeys(_gdal_options_applied))
 
 
 def get_tiger_url(state_fips: str, year: int = TIGER_YEAR) -> str:
@@ -13,6 +58,11 @@ def get_tiger_url(state_fips: str, year: int = TIGER_YEAR) -> str:
     return f"https://www2.census.gov/geo/tiger/TIGER{year}/TRACT/tl_{year}_{state_fips}_tract.zip"
 
 
+def get_tiger_vsi_path(state_fips: str, year: int = TIGER_YEAR) -> str:
+    """Construct GDAL virtual path that streams the remote zip via HTTP ranges."""
+    return f"/vsizip//vsicurl/{get_tiger_url(state_fips, year)}"
+
+
 def download_state_tracts(
     state_fips: str,
     year: int = TIGER_YEAR,
@@ -27,7 +77,7 @@ def download_state_tracts(
         force_download: If True, re-download even if cached
 
     Returns:
-        GeoDataFrame with tract geometries
+        GeoDataFrame with GEOID and tract geometries
     """
     ensure_cache_dirs()
     cache_path = get_tiger_cache_path(state_fips, year)
@@ -37,14 +87,21 @@ def download_state_tracts(
         return gpd.read_parquet(cache_path)
 
     # Download from Census Bureau
-    url = get_tiger_url(state_fips, year)
     state_name = FIPS_TO_STATE.get(state_fips, state_fips)
     print(f"Downloading TIGER/Line tracts for {state_name} ({state_fips})...")
 
-    gdf = gpd.read_file(url)
-
-    # Cache as GeoParquet
-    gdf.to_parquet(cache_path)
+    # pyogrio reads through GDAL's /vsicurl/ with range requests, so only the
+    # shapefile members are fetched instead of buffering the whole archive.
+    # Only GEOID is used downstream; skip the other attribute fields.
+    with _gdal_http_options():
+        gdf = gpd.read_file(
+            get_tiger_vsi_path(state_fips, year), engine="pyogrio", columns=["GEOID"]
+        )
+
+    # Cache as zstd GeoParquet (WKB geometry); row groups keep reads chunked
+    gdf.to_parquet(
+        cache_path, compression="zstd", compression_level=3, row_group_size=1024
+    )
     print(f"  Cached {len(gdf)} tracts to {cache_path}")
 
     return gdf
@@ -72,10 +129,7 @@ def download_all_tracts(
 
     # Concatenate all states
     print(f"Concatenating {len(all_gdfs)} state datasets...")
-    combined = gpd.GeoDataFrame(
-        pd.concat(all_gdfs, ignore_index=True),
-        crs=all_gdfs[0].crs,
-    )
+    combined = concat_frames(all_gdfs)
 
     print(f"Total tracts: {len(combined)}")
     return combined
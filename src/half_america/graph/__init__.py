@@ -7,8 +7,20 @@ from half_america.graph.boundary import (
     compute_graph_attributes,
     compute_rho,
 )
-from half_america.graph.network import build_flow_network, compute_energy, get_partition
-from half_america.graph.pipeline import GraphData, get_graph_summary, load_graph_data
+from half_america.graph.network import (
+    build_flow_network,
+    compute_energy,
+    get_partition,
+    update_source_capacities,
+)
+from half_america.graph.pipeline import (
+    GraphData,
+    get_graph_fingerprint,
+    get_graph_summary,
+    load_graph_data,
+    read_graph_data,
+    save_graph_data,
+)
 
 __all__ = [
     # Adjacency
@@ -21,10 +33,14 @@ __all__ = [
     "GraphAttributes",
     # Network
     "build_flow_network",
+    "update_source_capacities",
     "get_partition",
     "compute_energy",
     # Pipeline
     "load_graph_data",
+    "read_graph_data",
+    "save_graph_data",
     "get_graph_summary",
+    "get_graph_fingerprint",
     "GraphData",
 ]
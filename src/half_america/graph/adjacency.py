@@ -1,53 +1,112 @@
-"""Spatial adjacency graph construction using libpysal."""
+"""Spatial adjacency graph construction from shared polygon vertices."""
 
 from typing import NamedTuple
 
 import geopandas as gpd
-from libpysal.weights import Queen, W
-from libpysal.weights.distance import KNN
+import numpy as np
+import shapely
+from scipy.sparse import coo_array, csr_array
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
 
 class AdjacencyResult(NamedTuple):
     """Result of adjacency graph construction."""
 
-    weights: W
-    edges: list[tuple[int, int]]
+    adjacency: csr_array  # Symmetric n×n CSR; row i's indices are i's neighbors
+    edges: np.ndarray  # (E, 2) int32 pairs with i < j, column-major
     num_nodes: int
     num_edges: int
     num_islands_attached: int
+    num_components: int
 
 
-def _attach_islands_manual(w: W, gdf: gpd.GeoDataFrame) -> W:
+def _queen_edges(geoms: np.ndarray) -> np.ndarray:
     """
-    Attach island nodes to their nearest neighbors using KNN.
+    Find Queen contiguity pairs: polygons sharing at least one vertex.
+
+    Vertices are sorted by coordinate so that every tract touching a point
+    lands in one contiguous run; pairs are then emitted per run size with
+    NumPy instead of walking a neighbor dict in Python. This matches
+    libpysal's vertex-based Queen rule, which relies on the same exact
+    coordinate equality (guaranteed here by the cleaning precision grid).
 
     Args:
-        w: Weights object with potential islands
-        gdf: GeoDataFrame with geometries for distance calculation
+        geoms: Array of polygon geometries
+
+    Returns:
+        (E, 2) int64 array of unique (i, j) pairs with i < j, sorted
+    """
+    coords, owner = shapely.get_coordinates(geoms, return_index=True)
+
+    # Sort by (x, y, owner) and drop repeated vertices within a tract
+    # (ring closing points, multi-ring polygons)
+    order = np.lexsort((owner, coords[:, 1], coords[:, 0]))
+    x, y, owner = coords[order, 0], coords[order, 1], owner[order]
+    same_xy = (x[1:] == x[:-1]) & (y[1:] == y[:-1])
+    keep = np.ones(len(owner), dtype=bool)
+    keep[1:] = ~(same_xy & (owner[1:] == owner[:-1]))
+    x, y, owner = x[keep], y[keep], owner[keep]
+
+    # Runs of identical coordinates = tracts sharing that vertex
+    run_start = np.ones(len(owner), dtype=bool)
+    run_start[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+    starts = np.flatnonzero(run_start)
+    sizes = np.diff(np.append(starts, len(owner)))
+
+    # Owners are ascending within a run, so upper-triangle pairs have i < j
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    for k in np.unique(sizes[sizes > 1]):
+        members = owner[starts[sizes == k][:, None] + np.arange(k)]
+        a, b = np.triu_indices(k, 1)
+        pairs.append(np.column_stack([members[:, a].ravel(), members[:, b].ravel()]))
+    return _unique_pairs(np.concatenate(pairs), len(geoms))
+
+
+def _unique_pairs(pairs: np.ndarray, n: int) -> np.ndarray:
+    """
+    Sort and deduplicate (i, j) pairs via flat i * n + j keys.
+
+    Much faster than np.unique(axis=0), which sorts rows as opaque records.
+
+    Args:
+        pairs: (E, 2) array of node index pairs
+        n: Number of nodes (upper bound on indices)
 
     Returns:
-        New weights object with islands attached
+        (E', 2) int64 array of unique pairs in lexicographic order
     """
-    if not w.islands:
-        return w
+    pairs = pairs.astype(np.int64, copy=False)
+    keys = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.column_stack([keys // n, keys % n])
 
-    # Build KNN with k=1 to find nearest neighbor for each geometry
-    # Use centroids for distance calculation
-    knn = KNN.from_dataframe(gdf, k=1)
 
-    # Copy neighbors dict to modify
-    new_neighbors = {k: list(v) for k, v in w.neighbors.items()}
+def _attach_islands_manual(
+    pairs: np.ndarray, islands: np.ndarray, gdf: gpd.GeoDataFrame
+) -> np.ndarray:
+    """
+    Attach island nodes to their nearest neighbors by centroid distance.
 
-    for island in w.islands:
-        # Get the nearest neighbor from KNN
-        nearest = knn.neighbors[island][0]
+    Args:
+        pairs: (E, 2) array of existing (i, j) pairs with i < j
+        islands: Indices of nodes with no neighbors
+        gdf: GeoDataFrame with geometries for distance calculation
 
-        # Add bidirectional connection
-        new_neighbors[island].append(nearest)
-        new_neighbors[nearest].append(island)
+    Returns:
+        Sorted (E', 2) array of unique pairs including island connections
+    """
+    if len(islands) == 0:
+        return pairs
 
-    # Create new weights object
-    return W(new_neighbors)
+    # Query only the islands; k=2 because each centroid finds itself first
+    centroids = shapely.get_coordinates(shapely.centroid(gdf.geometry.values))
+    _, idx = cKDTree(centroids).query(centroids[islands], k=2)
+    nearest = np.where(idx[:, 0] == islands, idx[:, 1], idx[:, 0])
+
+    new_pairs = np.column_stack(
+        [np.minimum(islands, nearest), np.maximum(islands, nearest)]
+    )
+    return _unique_pairs(np.concatenate([pairs, new_pairs]), len(gdf))
 
 
 def build_adjacency(
@@ -65,46 +124,59 @@ def build_adjacency(
         verbose: If True, print progress messages
 
     Returns:
-        AdjacencyResult with weights object, edge list, and statistics
+        AdjacencyResult with CSR adjacency, edge list, and statistics
     """
     num_nodes = len(gdf)
 
     if verbose:
         print(f"Building adjacency graph for {num_nodes:,} tracts...")
 
-    # Build Queen contiguity with integer indices (0 to n-1)
-    # use_index=False ensures integer indexing for PyMaxFlow compatibility
-    w = Queen.from_dataframe(gdf, use_index=False)
+    # Queen contiguity with integer indices (0 to n-1) for PyMaxFlow
+    pairs = _queen_edges(np.asarray(gdf.geometry.values))
 
+    degree = np.bincount(pairs.ravel(), minlength=num_nodes)
     if verbose:
+        mean_neighbors = degree.mean() if num_nodes else 0.0
         print(
-            f"  Initial neighbors: mean={w.mean_neighbors:.1f}, max={w.max_neighbors}"
+            f"  Initial neighbors: mean={mean_neighbors:.1f}, "
+            f"max={degree.max(initial=0)}"
         )
 
     # Handle islands (tracts with no neighbors)
-    num_islands = len(w.islands)
+    islands = np.flatnonzero(degree == 0)
+    num_islands = len(islands)
     if num_islands > 0:
         if verbose:
             print(f"  Attaching {num_islands} island tracts to nearest neighbors...")
-        w = _attach_islands_manual(w, gdf)
-
-    # Extract unique edge pairs (i < j to avoid duplicates)
-    edges: list[tuple[int, int]] = []
-    for i, neighbors in w.neighbors.items():
-        for j in neighbors:
-            if i < j:
-                edges.append((i, j))
-
+        pairs = _attach_islands_manual(pairs, islands, gdf)
+
+    # Symmetric CSR adjacency; each row's column slice is a neighbor list
+    adjacency = coo_array(
+        (
+            np.ones(2 * len(pairs), dtype=np.int8),
+            (
+                np.concatenate([pairs[:, 0], pairs[:, 1]]),
+                np.concatenate([pairs[:, 1], pairs[:, 0]]),
+            ),
+        ),
+        shape=(num_nodes, num_nodes),
+    ).tocsr()
+    num_components, _ = connected_components(adjacency, directed=False)
+
+    # Column-major so edges[:, 0] and edges[:, 1] are contiguous src/dst
+    # vectors for the per-μ network builds and energy evaluations
+    edges = np.asfortranarray(pairs, dtype=np.int32)
     num_edges = len(edges)
 
     if verbose:
         print(f"  Final graph: {num_nodes:,} nodes, {num_edges:,} edges")
-        print(f"  Connected components: {w.n_components}")
+        print(f"  Connected components: {num_components}")
 
     return AdjacencyResult(
-        weights=w,
+        adjacency=adjacency,
         edges=edges,
         num_nodes=num_nodes,
         num_edges=num_edges,
         num_islands_attached=num_islands,
+        num_components=num_components,
     )
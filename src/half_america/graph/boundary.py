@@ -1,19 +1,26 @@
 """Shared boundary length calculations."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 import geopandas as gpd
 import numpy as np
-from shapely import intersection, length
+from shapely import bounds, intersection, length
+
+from half_america.config import MAX_WORKERS
+
+# Edges per intersection batch; bounds how many intersection geometries
+# are alive at once while giving each worker thread enough GEOS work
+EDGE_CHUNK_SIZE = 16_384
 
 
 class GraphAttributes(NamedTuple):
     """Computed graph attributes for optimization."""
 
-    population: np.ndarray  # p_i for each tract (int)
-    area: np.ndarray  # a_i for each tract in sq meters (float)
+    population: np.ndarray  # p_i for each tract (int32)
+    area: np.ndarray  # a_i for each tract in sq meters (float32)
     rho: float  # Characteristic length scale in meters
-    edge_lengths: dict[tuple[int, int], float]  # l_ij in meters
+    edge_lengths: np.ndarray  # l_ij in meters (float32), aligned with edges
 
 
 def compute_rho(gdf: gpd.GeoDataFrame) -> float:
@@ -22,33 +29,44 @@ def compute_rho(gdf: gpd.GeoDataFrame) -> float:
 
     ρ = median(√a_i) where a_i is tract area in square meters.
 
+    Since √ is monotonic, only the middle area(s) need a square root: the
+    median is selected with np.partition and the two middle roots are
+    averaged for even counts, matching np.median(np.sqrt(a)) exactly.
+
     Args:
         gdf: GeoDataFrame with area_sqm column
 
     Returns:
         Characteristic length scale in meters
     """
-    sqrt_areas = np.sqrt(gdf["area_sqm"].values)
-    return float(np.median(sqrt_areas))
+    areas = np.asarray(gdf["area_sqm"].values, dtype=np.float64)
+    n = len(areas)
+    mid = n // 2
+    if n % 2:
+        return float(np.sqrt(np.partition(areas, mid)[mid]))
+    middle = np.partition(areas, [mid - 1, mid])[mid - 1 : mid + 1]
+    return float(np.sqrt(middle).mean())
 
 
 def compute_boundary_lengths(
     gdf: gpd.GeoDataFrame,
-    edges: list[tuple[int, int]],
+    edges: np.ndarray,
     verbose: bool = True,
-) -> dict[tuple[int, int], float]:
+) -> np.ndarray:
     """
     Compute shared boundary lengths for all adjacent tract pairs.
 
-    Uses vectorized Shapely operations for performance.
+    Uses vectorized Shapely operations on edge chunks in a thread pool;
+    GEOS releases the GIL, so chunks intersect in parallel.
 
     Args:
         gdf: GeoDataFrame with tract geometries
-        edges: List of (i, j) neighbor pairs from adjacency graph
+        edges: (E, 2) array of (i, j) neighbor pairs from adjacency graph
         verbose: If True, print progress messages
 
     Returns:
-        Dictionary mapping (i, j) -> shared boundary length in meters
+        Array of shared boundary lengths in meters, where entry k is the
+        length for edges[k]
     """
     if verbose:
         print(f"Computing boundary lengths for {len(edges):,} edges...")
@@ -56,34 +74,44 @@ def compute_boundary_lengths(
     # Extract geometry boundaries (LineStrings)
     boundaries = gdf.geometry.boundary.values
 
-    # Prepare index arrays for vectorized operation
-    i_indices = np.array([e[0] for e in edges])
-    j_indices = np.array([e[1] for e in edges])
+    # Shared boundaries lie inside the overlap of the two bounding boxes. Pairs
+    # whose boxes are disjoint or meet at a single corner point (diagonal
+    # Queen contacts, attached islands) have zero length; skip GEOS for them.
+    b = bounds(boundaries)
+    bi, bj = b[edges[:, 0]], b[edges[:, 1]]
+    overlap_w = np.minimum(bi[:, 2], bj[:, 2]) - np.maximum(bi[:, 0], bj[:, 0])
+    overlap_h = np.minimum(bi[:, 3], bj[:, 3]) - np.maximum(bi[:, 1], bj[:, 1])
+    has_length = np.flatnonzero(
+        (overlap_w >= 0) & (overlap_h >= 0) & ((overlap_w > 0) | (overlap_h > 0))
+    )
+    candidates = edges[has_length]
 
-    # Vectorized intersection and length calculation
-    shared_boundaries = intersection(boundaries[i_indices], boundaries[j_indices])
-    lengths = length(shared_boundaries)
+    def chunk_lengths(start: int) -> np.ndarray:
+        chunk = candidates[start : start + EDGE_CHUNK_SIZE]
+        return length(intersection(boundaries[chunk[:, 0]], boundaries[chunk[:, 1]]))
 
-    # Build dictionary with both directions for easy lookup
-    edge_lengths: dict[tuple[int, int], float] = {}
-    for idx, (i, j) in enumerate(edges):
-        l_ij = float(lengths[idx])
-        edge_lengths[(i, j)] = l_ij
-        edge_lengths[(j, i)] = l_ij  # Symmetric
+    # Each chunk's intersections are reduced to lengths before the next is
+    # materialized, so only a few chunks of geometries are held at a time
+    lengths = np.zeros(len(edges), dtype=np.float32)
+    starts = range(0, len(candidates), EDGE_CHUNK_SIZE)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        lengths[has_length] = np.concatenate(
+            [np.empty(0, dtype=np.float64), *executor.map(chunk_lengths, starts)]
+        )
 
     if verbose:
-        nonzero_count = sum(1 for edge_len in lengths if edge_len > 0)
+        nonzero_count = int(np.count_nonzero(lengths))
         pct = 100 * nonzero_count / len(edges)
         print(f"  Non-zero boundary lengths: {nonzero_count:,} ({pct:.1f}%)")
-        print(f"  Mean boundary length: {np.mean(lengths):.1f} m")
+        print(f"  Mean boundary length: {np.mean(lengths, dtype=np.float64):.1f} m")
         print(f"  Max boundary length: {np.max(lengths):.1f} m")
 
-    return edge_lengths
+    return lengths
 
 
 def compute_graph_attributes(
     gdf: gpd.GeoDataFrame,
-    edges: list[tuple[int, int]],
+    edges: np.ndarray,
     verbose: bool = True,
 ) -> GraphAttributes:
     """
@@ -91,21 +119,24 @@ def compute_graph_attributes(
 
     Args:
         gdf: GeoDataFrame with population, area_sqm, and geometry columns
-        edges: List of (i, j) neighbor pairs from adjacency graph
+        edges: (E, 2) array of (i, j) neighbor pairs from adjacency graph
         verbose: If True, print progress messages
 
     Returns:
         GraphAttributes with population, area, rho, and edge_lengths
     """
-    population = gdf["population"].values.astype(np.int64)
-    area = gdf["area_sqm"].values.astype(np.float64)
+    # Compact dtypes halve memory traffic in the per-μ network builds; tract
+    # populations fit in int32 and float32 keeps ~7 significant digits.
+    # Reductions over these arrays accumulate in 64 bits.
+    population = gdf["population"].values.astype(np.int32)
+    area = gdf["area_sqm"].values.astype(np.float32)
     rho = compute_rho(gdf)
     edge_lengths = compute_boundary_lengths(gdf, edges, verbose=verbose)
 
     if verbose:
         print(f"  Characteristic length scale (ρ): {rho:.1f} m ({rho / 1000:.2f} km)")
-        print(f"  Total population: {population.sum():,}")
-        print(f"  Total area: {area.sum() / 1e6:.0f} km²")
+        print(f"  Total population: {population.sum(dtype=np.int64):,}")
+        print(f"  Total area: {area.sum(dtype=np.float64) / 1e6:.0f} km²")
 
     return GraphAttributes(
         population=population,
@@ -8,7 +8,7 @@ from half_america.graph.boundary import GraphAttributes
 
 def build_flow_network(
     attributes: GraphAttributes,
-    edges: list[tuple[int, int]],
+    edges: np.ndarray,
     lambda_param: float,
     mu: float,
 ) -> maxflow.Graph:
@@ -20,7 +20,7 @@ def build_flow_network(
 
     Args:
         attributes: GraphAttributes with population, area, rho, edge_lengths
-        edges: List of (i, j) neighbor pairs (only i < j pairs)
+        edges: (E, 2) array of (i, j) neighbor pairs (only i < j pairs)
         lambda_param: Surface tension parameter [0, 1]
         mu: Lagrange multiplier for population constraint
 
@@ -28,31 +28,59 @@ def build_flow_network(
         PyMaxFlow Graph ready for maxflow() computation
     """
     num_nodes = len(attributes.population)
-    num_edges = len(edges)
+
+    # Queen contiguity yields many corner-only (diagonal) neighbors with zero
+    # shared boundary. Their n-links have zero capacity and never affect the
+    # cut, so skip them to keep the network smaller.
+    has_boundary = attributes.edge_lengths > 0
+    edges = edges[has_boundary]
+    edge_lengths = attributes.edge_lengths[has_boundary]
 
     # Create graph with float capacities
-    g: maxflow.Graph = maxflow.Graph[float](num_nodes, num_edges)
-    g.add_nodes(num_nodes)
+    g: maxflow.Graph = maxflow.Graph[float](num_nodes, len(edges))
+    node_ids = g.add_grid_nodes(num_nodes)
 
-    # Add terminal edges (t-links)
+    # Add terminal edges (t-links) in one batched call
     # Source capacity: μ × p_i (population reward for inclusion)
     # Sink capacity: (1-λ) × a_i (area cost for inclusion)
-    for i in range(num_nodes):
-        source_cap = mu * attributes.population[i]
-        sink_cap = (1 - lambda_param) * attributes.area[i] / (attributes.rho**2)
-        g.add_tedge(i, source_cap, sink_cap)
-
-    # Add neighborhood edges (n-links)
-    # Capacity: λ × l_ij / ρ (boundary cost, normalized)
-    rho = attributes.rho
-    for i, j in edges:
-        l_ij = attributes.edge_lengths[(i, j)]
-        capacity = lambda_param * l_ij / rho
-        g.add_edge(i, j, capacity, capacity)  # Symmetric
+    source_caps = mu * attributes.population  # float64 (μ is a Python float)
+    sink_caps = ((1 - lambda_param) / attributes.rho**2) * attributes.area
+    g.add_grid_tedges(node_ids, source_caps, sink_caps)
+
+    # Add neighborhood edges (n-links) in one batched call
+    # Capacity: λ × l_ij / ρ (boundary cost, normalized), symmetric
+    capacities = (lambda_param / attributes.rho) * edge_lengths
+    g.add_edges(edges[:, 0], edges[:, 1], capacities, capacities)
 
     return g
 
 
+def update_source_capacities(
+    g: maxflow.Graph,
+    population: np.ndarray,
+    mu_old: float,
+    mu_new: float,
+) -> None:
+    """
+    Shift the source t-links of a solved network from μ_old to μ_new in place.
+
+    Only the population reward μ × p_i depends on μ, so the n-links and sink
+    capacities are untouched. Changed nodes are marked so the next
+    ``g.maxflow(reuse_trees=True)`` warm-starts from the previous search
+    trees and residual flow instead of solving from scratch.
+
+    Args:
+        g: PyMaxFlow Graph from build_flow_network(), already solved
+        population: p_i for each node
+        mu_old: μ currently encoded in the source capacities
+        mu_new: μ to encode
+    """
+    changed = np.flatnonzero(population)
+    deltas = (mu_new - mu_old) * population[changed]
+    g.add_grid_tedges(changed, deltas, np.zeros(len(changed)))
+    g.mark_grid_nodes(changed)
+
+
 def get_partition(g: maxflow.Graph, num_nodes: int) -> np.ndarray:
     """
     Extract partition assignment after maxflow computation.
@@ -64,12 +92,13 @@ def get_partition(g: maxflow.Graph, num_nodes: int) -> np.ndarray:
     Returns:
         Boolean array where True = node in source partition (selected)
     """
-    return np.array([g.get_segment(i) == 0 for i in range(num_nodes)])
+    # get_grid_segments returns True for the sink segment
+    return ~g.get_grid_segments(np.arange(num_nodes))
 
 
 def compute_energy(
     attributes: GraphAttributes,
-    edges: list[tuple[int, int]],
+    edges: np.ndarray,
     partition: np.ndarray,
     lambda_param: float,
     mu: float,
@@ -81,7 +110,7 @@ def compute_energy(
 
     Args:
         attributes: GraphAttributes with population, area, rho, edge_lengths
-        edges: List of (i, j) neighbor pairs
+        edges: (E, 2) array of (i, j) neighbor pairs
         partition: Boolean array where True = selected
         lambda_param: Surface tension parameter [0, 1)
         mu: Lagrange multiplier
@@ -90,19 +119,19 @@ def compute_energy(
         Total energy value (lower is better for the optimizer)
     """
     # Boundary cost: λ Σ(l_ij/ρ)|x_i - x_j|
-    # Only count edges crossing the cut (where x_i != x_j)
-    boundary_cost = 0.0
-    rho = attributes.rho
-    for i, j in edges:
-        if partition[i] != partition[j]:
-            l_ij = attributes.edge_lengths[(i, j)]
-            boundary_cost += lambda_param * l_ij / rho
+    # Only count edges crossing the cut (where x_i != x_j). Masked sums avoid
+    # materializing copies and accumulate the compact dtypes in 64 bits.
+    cut = partition[edges[:, 0]] ^ partition[edges[:, 1]]
+    boundary_length = attributes.edge_lengths.sum(where=cut, dtype=np.float64)
+    boundary_cost = (lambda_param / attributes.rho) * boundary_length
 
     # Area cost: (1-λ) Σ (a_i/ρ²) x_i (for selected nodes only)
     rho_sq = attributes.rho**2
-    area_cost = (1 - lambda_param) * attributes.area[partition].sum() / rho_sq
+    selected_area = attributes.area.sum(where=partition, dtype=np.float64)
+    area_cost = (1 - lambda_param) * selected_area / rho_sq
 
     # Population reward: μ Σ p_i x_i (for selected nodes only)
-    population_reward = mu * attributes.population[partition].sum()
+    selected_population = attributes.population.sum(where=partition, dtype=np.int64)
+    population_reward = mu * selected_population
 
-    return boundary_cost + area_cost - population_reward
+    return float(boundary_cost + area_cost - population_reward)
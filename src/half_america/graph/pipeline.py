@@ -1,6 +1,6 @@
 """Graph data pipeline with caching."""
 
-import pickle
+import hashlib
 from pathlib import Path
 from typing import NamedTuple
 
@@ -8,7 +8,11 @@ import geopandas as gpd
 import numpy as np
 
 from half_america.config import ACS_YEAR, TIGER_YEAR
-from half_america.data.cache import ensure_cache_dirs, get_processed_cache_path
+from half_america.data.cache import (
+    PROCESSED_SCHEMA_VERSION,
+    ensure_cache_dirs,
+    get_processed_cache_path,
+)
 from half_america.graph.adjacency import build_adjacency
 from half_america.graph.boundary import GraphAttributes, compute_graph_attributes
 
@@ -16,7 +20,7 @@ from half_america.graph.boundary import GraphAttributes, compute_graph_attribute
 class GraphData(NamedTuple):
     """Complete graph data for optimization."""
 
-    edges: list[tuple[int, int]]
+    edges: np.ndarray  # (E, 2) int32 pairs with i < j
     attributes: GraphAttributes
     num_nodes: int
     num_edges: int
@@ -24,11 +28,43 @@ class GraphData(NamedTuple):
 
 def _get_graph_cache_path() -> Path:
     """Get path to cached graph data."""
-    return get_processed_cache_path(f"graph_{TIGER_YEAR}_{ACS_YEAR}").with_suffix(
-        ".pkl"
+    # Built from the processed tracts, so it is stale whenever they are
+    name = f"graph_{TIGER_YEAR}_{ACS_YEAR}_v{PROCESSED_SCHEMA_VERSION}"
+    return get_processed_cache_path(name).with_suffix(".npz")
+
+
+def save_graph_data(graph_data: GraphData, path: Path) -> None:
+    """Save graph arrays to a compressed .npz archive."""
+    attrs = graph_data.attributes
+    np.savez_compressed(
+        path,
+        edges=graph_data.edges,
+        edge_lengths=attrs.edge_lengths,
+        population=attrs.population,
+        area=attrs.area,
+        rho=attrs.rho,
+        num_nodes=graph_data.num_nodes,
     )
 
 
+def read_graph_data(path: Path) -> GraphData:
+    """Load graph arrays saved by save_graph_data()."""
+    with np.load(path) as data:
+        edges = data["edges"]
+        attributes = GraphAttributes(
+            population=data["population"],
+            area=data["area"],
+            rho=float(data["rho"]),
+            edge_lengths=data["edge_lengths"],
+        )
+        return GraphData(
+            edges=edges,
+            attributes=attributes,
+            num_nodes=int(data["num_nodes"]),
+            num_edges=len(edges),
+        )
+
+
 def load_graph_data(
     gdf: gpd.GeoDataFrame,
     force_rebuild: bool = False,
@@ -54,8 +90,7 @@ def load_graph_data(
     if use_cache and cache_path.exists() and not force_rebuild:
         if verbose:
             print(f"Loading cached graph data from {cache_path}")
-        with open(cache_path, "rb") as f:
-            return pickle.load(f)
+        return read_graph_data(cache_path)
 
     if verbose:
         print("Building graph data...")
@@ -74,14 +109,31 @@ def load_graph_data(
     )
 
     # Cache result
-    with open(cache_path, "wb") as f:
-        pickle.dump(graph_data, f)
+    save_graph_data(graph_data, cache_path)
     if verbose:
         print(f"Cached graph data to {cache_path}")
 
     return graph_data
 
 
+def get_graph_fingerprint(graph_data: GraphData) -> str:
+    """
+    Hash the graph arrays that determine optimization results.
+
+    Args:
+        graph_data: GraphData to fingerprint
+
+    Returns:
+        Hex digest identifying the graph structure and attributes
+    """
+    attrs = graph_data.attributes
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (graph_data.edges, attrs.edge_lengths, attrs.population, attrs.area):
+        digest.update(np.ascontiguousarray(array).data)
+    digest.update(np.float64(attrs.rho).tobytes())
+    return digest.hexdigest()
+
+
 def get_graph_summary(graph_data: GraphData) -> dict:
     """
     Get summary statistics for graph data.
@@ -93,17 +145,17 @@ def get_graph_summary(graph_data: GraphData) -> dict:
         Dictionary with summary statistics
     """
     attrs = graph_data.attributes
-    edge_lengths = list(attrs.edge_lengths.values())[::2]  # Dedupe symmetric entries
+    edge_lengths = attrs.edge_lengths
 
     return {
         "num_nodes": graph_data.num_nodes,
         "num_edges": graph_data.num_edges,
-        "total_population": int(attrs.population.sum()),
-        "half_population": int(attrs.population.sum() // 2),
-        "total_area_sqkm": float(attrs.area.sum() / 1e6),
+        "total_population": int(attrs.population.sum(dtype=np.int64)),
+        "half_population": int(attrs.population.sum(dtype=np.int64) // 2),
+        "total_area_sqkm": float(attrs.area.sum(dtype=np.float64) / 1e6),
         "rho_meters": float(attrs.rho),
         "rho_km": float(attrs.rho / 1000),
-        "mean_boundary_length_m": float(np.mean(edge_lengths)),
+        "mean_boundary_length_m": float(np.mean(edge_lengths, dtype=np.float64)),
         "max_boundary_length_m": float(np.max(edge_lengths)),
         "mean_neighbors": graph_data.num_edges * 2 / graph_data.num_nodes,
     }
@@ -9,6 +9,7 @@ from half_america.optimization.search import (
 from half_america.optimization.solver import (
     TARGET_TOLERANCE,
     OptimizationResult,
+    solve_network,
     solve_partition,
 )
 from half_america.optimization.sweep import (
@@ -25,6 +26,7 @@ __all__ = [
     "TARGET_TOLERANCE",
     "OptimizationResult",
     "solve_partition",
+    "solve_network",
     # Search
     "DEFAULT_MAX_ITERATIONS",
     "DEFAULT_MU_MIN",
@@ -2,11 +2,19 @@
 
 from typing import NamedTuple
 
+import maxflow
+import numpy as np
+
+from half_america.graph.network import (
+    build_flow_network,
+    compute_energy,
+    update_source_capacities,
+)
 from half_america.graph.pipeline import GraphData
 from half_america.optimization.solver import (
     TARGET_TOLERANCE,
     OptimizationResult,
-    solve_partition,
+    solve_network,
 )
 
 
@@ -33,11 +41,15 @@ def find_optimal_mu(
     mu_min: float = DEFAULT_MU_MIN,
     mu_max: float | None = None,
     verbose: bool = True,
+    mu_hint: float | None = None,
 ) -> SearchResult:
     """
     Binary search for μ that achieves target population fraction.
 
-    Exploits monotonicity: higher μ → more tracts selected.
+    Exploits monotonicity: higher μ → more tracts selected. With a hint
+    (e.g. the optimal μ of a nearby λ), the search probes the hint first and
+    doubles/halves away from it until the target is bracketed, then bisects
+    that much narrower interval.
 
     Args:
         graph_data: GraphData from load_graph_data()
@@ -48,11 +60,12 @@ def find_optimal_mu(
         mu_min: Lower bound for μ (default 0.0)
         mu_max: Upper bound for μ (auto-scaled if None)
         verbose: Print diagnostic output
+        mu_hint: Expected μ to probe first (ignored if outside the bounds)
 
     Returns:
         SearchResult with final OptimizationResult and search metadata
     """
-    total_pop = graph_data.attributes.population.sum()
+    total_pop = graph_data.attributes.population.sum(dtype=np.int64)
     target_pop = target_fraction * total_pop
     pop_tolerance = tolerance * total_pop
 
@@ -68,16 +81,35 @@ def find_optimal_mu(
     mu_history: list[float] = []
     result: OptimizationResult | None = None
 
+    # One network per λ: only the μ-dependent source t-links change between
+    # iterations, so later probes shift them in place and warm-start maxflow
+    g: maxflow.Graph | None = None
+
+    # Gallop from the hint: probe it, then keep doubling (or halving) μ in
+    # the same direction until the selection crosses the target
+    probe = mu_hint if mu_hint is not None and mu_min < mu_hint < mu_max else None
+    gallop_direction = 0
+
     for iteration in range(max_iterations):
-        mu = (mu_min + mu_max) / 2
-        mu_history.append(mu)
+        mu = probe if probe is not None else (mu_min + mu_max) / 2
 
-        result = solve_partition(
+        if g is None:
+            g = build_flow_network(
+                graph_data.attributes, graph_data.edges, lambda_param, mu
+            )
+        else:
+            update_source_capacities(
+                g, graph_data.attributes.population, mu_history[-1], mu
+            )
+        result = solve_network(
             graph_data,
+            g,
             lambda_param,
             mu,
-            verbose=False,
+            reuse_trees=bool(mu_history),
+            exact_energy=False,
         )
+        mu_history.append(mu)
 
         error = result.selected_population - target_pop
 
@@ -94,31 +126,61 @@ def find_optimal_mu(
             if verbose:
                 print(f"  Converged in {iteration + 1} iterations")
             return SearchResult(
-                result=result,
+                result=_with_exact_energy(graph_data, result),
                 iterations=iteration + 1,
                 mu_history=mu_history,
                 converged=True,
             )
 
         # Binary search step
-        if result.selected_population < target_pop:
+        direction = 1 if result.selected_population < target_pop else -1
+        if direction > 0:
             mu_min = mu  # Need more selection → increase reward
         else:
             mu_max = mu  # Need less selection → decrease reward
 
+        if probe is not None and gallop_direction in (0, direction):
+            gallop_direction = direction
+            probe = mu * 2 if direction > 0 else mu / 2
+            if not mu_min < probe < mu_max:
+                probe = None
+        else:
+            probe = None
+
+        # The target lies in a jump of the μ → population step function:
+        # stop once no float64 μ is left strictly inside the bracket
+        if probe is None and not mu_min < (mu_min + mu_max) / 2 < mu_max:
+            if verbose:
+                print("  μ bracket exhausted at float64 precision")
+            break
+
     # Did not converge
     if verbose:
-        print(f"  Did not converge in {max_iterations} iterations")
+        print(f"  Did not converge in {len(mu_history)} iterations")
 
     assert result is not None  # Always at least one iteration
     return SearchResult(
-        result=result,
-        iterations=max_iterations,
+        result=_with_exact_energy(graph_data, result),
+        iterations=len(mu_history),
         mu_history=mu_history,
         converged=False,
     )
 
 
+def _with_exact_energy(
+    graph_data: GraphData, result: OptimizationResult
+) -> OptimizationResult:
+    """Replace the cut-derived energy of a search probe with the exact value."""
+    energy = compute_energy(
+        graph_data.attributes,
+        graph_data.edges,
+        result.partition,
+        result.lambda_param,
+        result.mu,
+    )
+    return result._replace(energy=energy)
+
+
 def _estimate_mu_max(graph_data: GraphData) -> float:
     """
     Estimate upper bound for μ based on data characteristics.
@@ -127,8 +189,8 @@ def _estimate_mu_max(graph_data: GraphData) -> float:
     We want μ × p_i to be comparable to (1-λ) × a_i / ρ².
     """
     attrs = graph_data.attributes
-    total_area = attrs.area.sum()
-    total_pop = attrs.population.sum()
+    total_area = attrs.area.sum(dtype=np.float64)
+    total_pop = attrs.population.sum(dtype=np.int64)
     rho_sq = attrs.rho**2
 
     # Scale factor: normalized area per person, with headroom
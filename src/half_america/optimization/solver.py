@@ -2,6 +2,7 @@
 
 from typing import NamedTuple
 
+import maxflow
 import numpy as np
 
 from half_america.graph.network import build_flow_network, compute_energy, get_partition
@@ -28,6 +29,17 @@ class OptimizationResult(NamedTuple):
 TARGET_TOLERANCE = 0.01
 
 
+def _validate_parameters(lambda_param: float, mu: float) -> None:
+    """Raise ValueError for λ outside [0, 1) or negative μ."""
+    if not 0 <= lambda_param < 1:
+        raise ValueError(
+            f"lambda_param must be in [0, 1), got {lambda_param}. "
+            "lambda=1.0 causes convergence failure (zero area cost)."
+        )
+    if mu < 0:
+        raise ValueError(f"mu must be non-negative, got {mu}")
+
+
 def solve_partition(
     graph_data: GraphData,
     lambda_param: float,
@@ -49,14 +61,7 @@ def solve_partition(
     Raises:
         ValueError: If lambda_param not in [0, 1] or mu < 0
     """
-    # Validate parameters
-    if not 0 <= lambda_param < 1:
-        raise ValueError(
-            f"lambda_param must be in [0, 1), got {lambda_param}. "
-            "lambda=1.0 causes convergence failure (zero area cost)."
-        )
-    if mu < 0:
-        raise ValueError(f"mu must be non-negative, got {mu}")
+    _validate_parameters(lambda_param, mu)
 
     if verbose:
         print(f"Solving partition for λ={lambda_param:.2f}, μ={mu:.6f}...")
@@ -68,15 +73,50 @@ def solve_partition(
         lambda_param,
         mu,
     )
-    flow_value = g.maxflow()
+    return solve_network(graph_data, g, lambda_param, mu, verbose=verbose)
+
+
+def solve_network(
+    graph_data: GraphData,
+    g: maxflow.Graph,
+    lambda_param: float,
+    mu: float,
+    reuse_trees: bool = False,
+    exact_energy: bool = True,
+    verbose: bool = False,
+) -> OptimizationResult:
+    """
+    Run maxflow on a prepared flow network and summarize the partition.
+
+    Args:
+        graph_data: GraphData the network was built from
+        g: Network from build_flow_network() encoding lambda_param and mu
+        lambda_param: Surface tension parameter [0, 1)
+        mu: Lagrange multiplier for population constraint (non-negative)
+        reuse_trees: Warm-start from the previous maxflow() on g (requires
+            changed nodes to be marked, see update_source_capacities())
+        exact_energy: If False, skip the O(E) energy evaluation and derive
+            energy from the cut instead (cut = E + μ Σ p_i), which carries
+            the rounding error of the double-precision flow accumulated by
+            PyMaxflow and of subtracting μ Σ p_i
+        verbose: Print diagnostic output
+
+    Returns:
+        OptimizationResult with partition and statistics
+
+    Raises:
+        ValueError: If lambda_param not in [0, 1) or mu < 0
+    """
+    _validate_parameters(lambda_param, mu)
+    flow_value = g.maxflow(reuse_trees=reuse_trees)
     partition = get_partition(g, graph_data.num_nodes)
 
     # Compute statistics
     attrs = graph_data.attributes
-    selected_population = int(attrs.population[partition].sum())
-    selected_area = float(attrs.area[partition].sum())
-    total_population = int(attrs.population.sum())
-    total_area = float(attrs.area.sum())
+    selected_population = int(attrs.population.sum(where=partition, dtype=np.int64))
+    selected_area = float(attrs.area.sum(where=partition, dtype=np.float64))
+    total_population = int(attrs.population.sum(dtype=np.int64))
+    total_area = float(attrs.area.sum(dtype=np.float64))
     population_fraction = selected_population / total_population
     satisfied_target = abs(population_fraction - 0.5) <= TARGET_TOLERANCE
 
@@ -95,13 +135,16 @@ def solve_partition(
             print(f"  Target satisfied: No (need 49-51%, got {pct:.2f}%)")
 
     # Compute energy function value
-    energy = compute_energy(
-        graph_data.attributes,
-        graph_data.edges,
-        partition,
-        lambda_param,
-        mu,
-    )
+    if exact_energy:
+        energy = compute_energy(
+            graph_data.attributes,
+            graph_data.edges,
+            partition,
+            lambda_param,
+            mu,
+        )
+    else:
+        energy = flow_value - mu * total_population
 
     return OptimizationResult(
         partition=partition,
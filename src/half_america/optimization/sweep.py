@@ -1,13 +1,26 @@
 """Lambda parameter sweep for pre-computing optimization results."""
 
-import pickle
+import json
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from functools import partial
 from pathlib import Path
-from typing import NamedTuple
+from typing import Literal, NamedTuple
 
-from half_america.graph.pipeline import GraphData
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from half_america.graph.pipeline import GraphData, get_graph_fingerprint
 from half_america.optimization.search import SearchResult, find_optimal_mu
+from half_america.optimization.solver import TARGET_TOLERANCE, OptimizationResult
 
 
 class LambdaResult(NamedTuple):
@@ -26,6 +39,9 @@ class SweepResult(NamedTuple):
     total_iterations: int  # Total binary search iterations across all λ
     total_elapsed_seconds: float  # Total wall-clock time
     all_converged: bool  # True if all λ values converged
+    target_fraction: float  # Target population fraction searched for
+    tolerance: float  # Population tolerance searched with
+    graph_fingerprint: str | None  # get_graph_fingerprint() of the input graph
 
 
 # Default λ values: 0.0, 0.1, ..., 0.9
@@ -38,6 +54,7 @@ def _run_single_lambda(
     lambda_param: float,
     target_fraction: float,
     tolerance: float,
+    mu_hint: float | None = None,
 ) -> LambdaResult:
     """Run optimization for a single λ value with timing."""
     start = time.perf_counter()
@@ -47,6 +64,7 @@ def _run_single_lambda(
         target_fraction=target_fraction,
         tolerance=tolerance,
         verbose=False,
+        mu_hint=mu_hint,
     )
     elapsed = time.perf_counter() - start
     return LambdaResult(
@@ -56,19 +74,47 @@ def _run_single_lambda(
     )
 
 
+# Graph shared by the tasks of one process-pool worker, set by _init_worker
+_worker_graph_data: GraphData | None = None
+
+
+def _init_worker(graph_data: GraphData) -> None:
+    """Receive the graph once per worker process instead of once per task."""
+    global _worker_graph_data
+    _worker_graph_data = graph_data
+
+
+def _run_single_lambda_in_worker(
+    lambda_param: float,
+    target_fraction: float,
+    tolerance: float,
+    mu_hint: float | None = None,
+) -> LambdaResult:
+    """Run _run_single_lambda on the graph installed by _init_worker."""
+    assert _worker_graph_data is not None
+    return _run_single_lambda(
+        _worker_graph_data, lambda_param, target_fraction, tolerance, mu_hint
+    )
+
+
 def sweep_lambda(
     graph_data: GraphData,
     lambda_values: list[float] | None = None,
     target_fraction: float = 0.5,
-    tolerance: float = 0.01,
+    tolerance: float = TARGET_TOLERANCE,
     max_workers: int | None = None,
     verbose: bool = True,
     raise_on_failure: bool = True,
+    initial_results: dict[float, LambdaResult] | None = None,
+    warm_start: bool = False,
+    backend: Literal["thread", "process"] = "thread",
 ) -> SweepResult:
     """
     Run optimization across a range of λ (surface tension) values.
 
     Uses parallel execution since each λ optimization is independent.
+    PyMaxflow releases the GIL inside maxflow(), so threads share one
+    GraphData without pickling and still solve concurrently.
 
     Args:
         graph_data: Input graph with edges and attributes
@@ -79,6 +125,16 @@ def sweep_lambda(
         verbose: Print progress information
         raise_on_failure: If True (default), raise RuntimeError on non-convergence.
             If False, continue and include non-converged results.
+        initial_results: Previously computed results (e.g. from an earlier
+            sweep cache). λ values found here are reused instead of re-solved,
+            and the others start their μ search from the nearest one's μ.
+        warm_start: If True, solve λ values sequentially in ascending order,
+            seeding each μ search with the previous λ's optimum. Saves
+            iterations per λ but gives up the parallel workers.
+        backend: "thread" (default) shares graph_data across threads, which
+            run maxflow concurrently since PyMaxflow releases the GIL.
+            "process" copies graph_data once into each worker process so
+            the NumPy bookkeeping between solves also runs in parallel.
 
     Returns:
         SweepResult with optimization results for each λ value
@@ -88,6 +144,9 @@ def sweep_lambda(
     """
     if lambda_values is None:
         lambda_values = DEFAULT_LAMBDA_VALUES.copy()
+    # Solves are CPU-bound, so don't oversubscribe like the executor default
+    if max_workers is None:
+        max_workers = os.cpu_count()
 
     if verbose:
         print(f"Starting λ sweep: {len(lambda_values)} values")
@@ -95,57 +154,92 @@ def sweep_lambda(
         tgt_pct = target_fraction * 100
         tol_pct = tolerance * 100
         print(f"  Target: {tgt_pct:.0f}% population ± {tol_pct:.0f}%")
-        print(f"  Parallel workers: {max_workers or 'auto'}")
+        if warm_start:
+            print("  Sequential warm-started μ search")
+        else:
+            print(f"  Parallel workers: {max_workers}")
 
     results: dict[float, LambdaResult] = {}
+    if initial_results:
+        results = {
+            lam: initial_results[lam] for lam in lambda_values if lam in initial_results
+        }
+        if verbose and results:
+            print(f"  Reusing {len(results)} previously computed λ values")
+    pending = [lam for lam in lambda_values if lam not in results]
+
+    def mu_hint(lam: float) -> float | None:
+        """Optimal μ of the nearest already-solved λ, if any."""
+        if not results:
+            return None
+        nearest = min(results, key=lambda known: abs(known - lam))
+        return results[nearest].search_result.result.mu
+
+    def record(lam: float, result: LambdaResult) -> None:
+        """Store one λ's result, report it, and enforce convergence."""
+        results[lam] = result
+
+        if verbose:
+            opt = result.search_result.result
+            print(
+                f"  λ={lam:.1f}: {opt.population_fraction * 100:.2f}% pop, "
+                f"μ={opt.mu:.6f}, {result.search_result.iterations} iters, "
+                f"{result.elapsed_seconds:.2f}s"
+            )
+
+        # Early termination check
+        if not result.search_result.converged:
+            if raise_on_failure:
+                raise RuntimeError(
+                    f"λ={lam} failed to converge after "
+                    f"{result.search_result.iterations} iterations"
+                )
+            elif verbose:
+                print(f"  WARNING: λ={lam} did not converge")
+
     total_start = time.perf_counter()
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_lambda = {
-            executor.submit(
-                _run_single_lambda,
-                graph_data,
+    if warm_start:
+        # Walk λ in order so each search starts from its neighbour's μ
+        for lam in sorted(pending):
+            record(
                 lam,
-                target_fraction,
-                tolerance,
-            ): lam
-            for lam in lambda_values
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_lambda):
-            lam = future_to_lambda[future]
-            try:
-                result = future.result()
-                results[lam] = result
-
-                if verbose:
-                    opt = result.search_result.result
-                    print(
-                        f"  λ={lam:.1f}: {opt.population_fraction * 100:.2f}% pop, "
-                        f"μ={opt.mu:.6f}, {result.search_result.iterations} iters, "
-                        f"{result.elapsed_seconds:.2f}s"
-                    )
-
-                # Early termination check
-                if not result.search_result.converged:
-                    if raise_on_failure:
-                        # Cancel remaining futures
-                        for f in future_to_lambda:
-                            f.cancel()
-                        raise RuntimeError(
-                            f"λ={lam} failed to converge after "
-                            f"{result.search_result.iterations} iterations"
-                        )
-                    elif verbose:
-                        print(f"  WARNING: λ={lam} did not converge")
-
-            except Exception:
-                # Cancel remaining futures on any error
-                for f in future_to_lambda:
-                    f.cancel()
-                raise
+                _run_single_lambda(
+                    graph_data, lam, target_fraction, tolerance, mu_hint(lam)
+                ),
+            )
+    else:
+        executor: Executor
+        task: Callable[..., LambdaResult]
+        if backend == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(graph_data,),
+            )
+            task = _run_single_lambda_in_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            task = partial(_run_single_lambda, graph_data)
+
+        with executor:
+            # Submit all tasks
+            future_to_lambda = {
+                executor.submit(
+                    task, lam, target_fraction, tolerance, mu_hint(lam)
+                ): lam
+                for lam in pending
+            }
+
+            # Collect results as they complete
+            for future in as_completed(future_to_lambda):
+                try:
+                    record(future_to_lambda[future], future.result())
+                except Exception:
+                    # Cancel remaining futures on any error
+                    for f in future_to_lambda:
+                        f.cancel()
+                    raise
 
     total_elapsed = time.perf_counter() - total_start
     total_iterations = sum(r.search_result.iterations for r in results.values())
@@ -163,26 +257,72 @@ def sweep_lambda(
         total_iterations=total_iterations,
         total_elapsed_seconds=total_elapsed,
         all_converged=all_converged,
+        target_fraction=target_fraction,
+        tolerance=tolerance,
+        graph_fingerprint=get_graph_fingerprint(graph_data),
     )
 
 
+# Schema metadata key holding sweep-level fields
+_SWEEP_METADATA_KEY = b"half_america.sweep"
+
+# OptimizationResult scalar fields stored as one column each
+_RESULT_COLUMNS = [
+    f for f in OptimizationResult._fields if f not in ("partition", "lambda_param")
+]
+
+
 def save_sweep_result(result: SweepResult, path: Path) -> None:
-    """Save sweep result to disk.
+    """Save sweep result to disk as zstd-compressed Feather (Arrow IPC).
+
+    Each λ is stored as one row. Partitions are bit-packed Arrow booleans,
+    and sweep-level fields are kept in the schema metadata.
 
     Args:
         result: SweepResult from sweep_lambda()
-        path: Output path (should end in .pkl)
+        path: Output path (should end in .feather)
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "wb") as f:
-        pickle.dump(result, f)
+
+    lambda_results = list(result.results.values())
+    opt_results = [r.search_result.result for r in lambda_results]
+
+    columns: dict[str, pa.Array] = {
+        "lambda_param": pa.array([r.lambda_param for r in lambda_results]),
+        "elapsed_seconds": pa.array([r.elapsed_seconds for r in lambda_results]),
+        "iterations": pa.array([r.search_result.iterations for r in lambda_results]),
+        "converged": pa.array([r.search_result.converged for r in lambda_results]),
+        "mu_history": pa.array(
+            [r.search_result.mu_history for r in lambda_results],
+            type=pa.list_(pa.float64()),
+        ),
+        "partition": pa.array(
+            [opt.partition for opt in opt_results], type=pa.list_(pa.bool_())
+        ),
+    }
+    for name in _RESULT_COLUMNS:
+        columns[name] = pa.array([getattr(opt, name) for opt in opt_results])
+
+    metadata = {
+        "lambda_values": result.lambda_values,
+        "total_iterations": result.total_iterations,
+        "total_elapsed_seconds": result.total_elapsed_seconds,
+        "all_converged": result.all_converged,
+        "target_fraction": result.target_fraction,
+        "tolerance": result.tolerance,
+        "graph_fingerprint": result.graph_fingerprint,
+    }
+    table = pa.table(columns).replace_schema_metadata(
+        {_SWEEP_METADATA_KEY: json.dumps(metadata)}
+    )
+    feather.write_feather(table, path, compression="zstd", compression_level=6)
 
 
 def load_sweep_result(path: Path) -> SweepResult:
     """Load sweep result from disk.
 
     Args:
-        path: Path to saved .pkl file
+        path: Path to saved .feather file
 
     Returns:
         SweepResult that was previously saved
@@ -190,5 +330,41 @@ def load_sweep_result(path: Path) -> SweepResult:
     Raises:
         FileNotFoundError: If path does not exist
     """
-    with open(path, "rb") as f:
-        return pickle.load(f)
+    table = feather.read_table(path, memory_map=True)
+    metadata = json.loads(table.schema.metadata[_SWEEP_METADATA_KEY])
+    rows = table.drop_columns(["partition"]).to_pylist()
+    partitions = table.column("partition")
+
+    results: dict[float, LambdaResult] = {}
+    for idx, row in enumerate(rows):
+        partition = np.asarray(
+            partitions[idx].values.to_numpy(zero_copy_only=False), dtype=bool
+        )
+        opt_result = OptimizationResult(
+            partition=partition,
+            lambda_param=row["lambda_param"],
+            **{name: row[name] for name in _RESULT_COLUMNS},
+        )
+        search_result = SearchResult(
+            result=opt_result,
+            iterations=row["iterations"],
+            mu_history=row["mu_history"],
+            converged=row["converged"],
+        )
+        results[row["lambda_param"]] = LambdaResult(
+            lambda_param=row["lambda_param"],
+            search_result=search_result,
+            elapsed_seconds=row["elapsed_seconds"],
+        )
+
+    return SweepResult(
+        results=results,
+        lambda_values=metadata["lambda_values"],
+        total_iterations=metadata["total_iterations"],
+        total_elapsed_seconds=metadata["total_elapsed_seconds"],
+        all_converged=metadata["all_converged"],
+        # Caches from before these were recorded used the sweep defaults
+        target_fraction=metadata.get("target_fraction", 0.5),
+        tolerance=metadata.get("tolerance", TARGET_TOLERANCE),
+        graph_fingerprint=metadata.get("graph_fingerprint"),
+    )
@@ -3,6 +3,7 @@
 from half_america.postprocess.dissolve import (
     DissolveResult,
     dissolve_all_lambdas,
+    dissolve_lambda,
     dissolve_partition,
 )
 from half_america.postprocess.export import (
@@ -11,6 +12,7 @@ from half_america.postprocess.export import (
     ExportResult,
     export_all_lambdas,
     export_combined_topojson,
+    export_lambda,
     export_to_topojson,
 )
 from half_america.postprocess.simplify import (
@@ -24,6 +26,7 @@ __all__ = [
     # Dissolve
     "DissolveResult",
     "dissolve_partition",
+    "dissolve_lambda",
     "dissolve_all_lambdas",
     # Simplify
     "DEFAULT_TOLERANCE",
@@ -35,6 +38,7 @@ __all__ = [
     "ExportMetadata",
     "ExportResult",
     "export_to_topojson",
+    "export_lambda",
     "export_all_lambdas",
     "export_combined_topojson",
 ]
@@ -1,11 +1,13 @@
 """Dissolve selected tracts into merged geometries."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 import geopandas as gpd
 import numpy as np
 import shapely
 from shapely import MultiPolygon, Polygon
+from shapely.errors import GEOSException
 
 from half_america.optimization.sweep import SweepResult
 
@@ -54,11 +56,23 @@ def dissolve_partition(
     if num_selected == 0:
         raise ValueError("No tracts selected (partition is all False)")
 
-    # Filter to selected tracts
-    selected = gdf[partition]
-
-    # Merge all geometries using coverage union (efficient for non-overlapping)
-    geom = selected.geometry.union_all()
+    # Filter to selected tract geometries (no need to copy other columns)
+    selected = np.asarray(gdf.geometry.values)[partition]
+
+    # Merge all geometries using coverage union. Quantized tracts form a
+    # polygonal coverage (no overlaps, shared edges), so this is linear in
+    # the number of edges rather than a full overlay union.
+    # Fall back to overlay union if the input was not a clean coverage:
+    # GEOS raises on incorrectly noded input (e.g. T-junctions) and may
+    # return an invalid result for overlaps. Checking the output is cheaper
+    # than validating the input coverage up front (shapely.coverage_is_valid
+    # costs more than the union itself).
+    try:
+        geom = shapely.coverage_union_all(selected)
+    except GEOSException:
+        geom = None
+    if geom is None or not geom.is_valid:
+        geom = shapely.union_all(selected)
 
     # Validate and fix if needed
     if not geom.is_valid:
@@ -88,10 +102,36 @@ def dissolve_partition(
     )
 
 
+def dissolve_lambda(
+    gdf: gpd.GeoDataFrame,
+    sweep_result: SweepResult,
+    lambda_val: float,
+) -> DissolveResult:
+    """
+    Dissolve the partition for a single lambda value in a sweep result.
+
+    Args:
+        gdf: GeoDataFrame with tract geometries (from load_all_tracts)
+        sweep_result: SweepResult from sweep_lambda()
+        lambda_val: Lambda value to dissolve (must be in sweep_result.results)
+
+    Returns:
+        DissolveResult with merged geometry and metadata
+    """
+    opt_result = sweep_result.results[lambda_val].search_result.result
+    return dissolve_partition(
+        gdf,
+        opt_result.partition,
+        opt_result.selected_population,
+        opt_result.total_population,
+    )
+
+
 def dissolve_all_lambdas(
     gdf: gpd.GeoDataFrame,
     sweep_result: SweepResult,
     verbose: bool = True,
+    max_workers: int = 1,
 ) -> dict[float, DissolveResult]:
     """
     Dissolve partitions for all lambda values in a sweep result.
@@ -100,23 +140,34 @@ def dissolve_all_lambdas(
         gdf: GeoDataFrame with tract geometries (from load_all_tracts)
         sweep_result: SweepResult from sweep_lambda()
         verbose: Print progress messages
+        max_workers: Lambda values dissolved concurrently (Shapely releases
+            the GIL)
 
     Returns:
         Dictionary mapping lambda values to DissolveResult
     """
     results: dict[float, DissolveResult] = {}
 
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outputs = executor.map(
+                lambda lam: dissolve_lambda(gdf, sweep_result, lam),
+                sweep_result.lambda_values,
+            )
+            for lambda_val, result in zip(sweep_result.lambda_values, outputs):
+                results[lambda_val] = result
+                if verbose:
+                    print(
+                        f"Dissolved λ={lambda_val:.2f}: {result.num_tracts:,} "
+                        f"tracts → {result.num_parts} parts"
+                    )
+        return results
+
     for lambda_val in sweep_result.lambda_values:
         if verbose:
             print(f"Dissolving λ={lambda_val:.2f}...")
 
-        opt_result = sweep_result.results[lambda_val].search_result.result
-        partition = opt_result.partition
-        population_selected = opt_result.selected_population
-        total_population = opt_result.total_population
-        result = dissolve_partition(
-            gdf, partition, population_selected, total_population
-        )
+        result = dissolve_lambda(gdf, sweep_result, lambda_val)
         results[lambda_val] = result
 
         if verbose:
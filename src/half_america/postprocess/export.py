@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -40,6 +41,18 @@ class ExportMetadata(NamedTuple):
     total_area_all_sqm: float  # Total area of all tracts (entire US)
 
 
+def _write_topojson(topo: Topology, output_path: Path) -> None:
+    """Write a Topology as compact JSON, creating the parent directory."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # topo.to_json(path) streams through json.dump, which always uses the
+    # pure-Python encoder; serializing to a string first runs the C encoder
+    # (~4x faster, byte-identical output)
+    text = topo.to_json()
+    assert text is not None  # Only None when given a file path to write to
+    output_path.write_text(text, encoding="utf-8")
+
+
 def export_to_topojson(
     geometry: MultiPolygon | Polygon,
     output_path: Path,
@@ -91,11 +104,7 @@ def export_to_topojson(
         object_name=object_name,
     )
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to file
-    topo.to_json(str(output_path))
+    _write_topojson(topo, output_path)
 
     return ExportResult(
         path=output_path,
@@ -105,12 +114,59 @@ def export_to_topojson(
     )
 
 
+def export_lambda(
+    lambda_val: float,
+    simplify_result: SimplifyResult,
+    dissolve_result: DissolveResult,
+    sweep_result: SweepResult,
+    output_dir: Path | None = None,
+) -> ExportResult:
+    """
+    Export the simplified geometry for a single lambda value to TopoJSON.
+
+    Args:
+        lambda_val: Lambda value being exported
+        simplify_result: SimplifyResult for this lambda
+        dissolve_result: DissolveResult for this lambda
+            (needed for population/area metadata)
+        sweep_result: SweepResult with optimization results (needed for total_area)
+        output_dir: Output directory (default: data/output/topojson)
+
+    Returns:
+        ExportResult for the written lambda_X.XX.json file
+    """
+    if output_dir is None:
+        output_dir = TOPOJSON_DIR
+
+    # Get total area from sweep result
+    opt_result = sweep_result.results[lambda_val].search_result.result
+    total_area_all_sqm = opt_result.total_area
+
+    # Build metadata from dissolve result
+    metadata = ExportMetadata(
+        lambda_value=lambda_val,
+        population_selected=dissolve_result.population_selected,
+        total_population=dissolve_result.total_population,
+        area_sqm=dissolve_result.total_area_sqm,
+        num_parts=dissolve_result.num_parts,
+        total_area_all_sqm=total_area_all_sqm,
+    )
+
+    output_path = output_dir / f"lambda_{lambda_val:.2f}.json"
+    return export_to_topojson(
+        geometry=simplify_result.geometry,
+        output_path=output_path,
+        metadata=metadata,
+    )
+
+
 def export_all_lambdas(
     simplify_results: dict[float, SimplifyResult],
     dissolve_results: dict[float, DissolveResult],
     sweep_result: SweepResult,
     output_dir: Path | None = None,
     verbose: bool = True,
+    max_workers: int = 1,
 ) -> dict[float, ExportResult]:
     """
     Export simplified geometries for all lambda values to individual TopoJSON files.
@@ -122,6 +178,7 @@ def export_all_lambdas(
         sweep_result: SweepResult with optimization results (needed for total_area)
         output_dir: Output directory (default: data/output/topojson)
         verbose: Print progress messages
+        max_workers: Lambda values exported concurrently
 
     Returns:
         Dictionary mapping lambda values to ExportResult
@@ -131,38 +188,26 @@ def export_all_lambdas(
 
     results: dict[float, ExportResult] = {}
 
-    for lambda_val in simplify_results:
-        if verbose:
-            print(f"Exporting λ={lambda_val:.2f}...")
-
-        simplify_result = simplify_results[lambda_val]
-        dissolve_result = dissolve_results[lambda_val]
-
-        # Get total area from sweep result
-        opt_result = sweep_result.results[lambda_val].search_result.result
-        total_area_all_sqm = opt_result.total_area
-
-        # Build metadata from dissolve result
-        metadata = ExportMetadata(
-            lambda_value=lambda_val,
-            population_selected=dissolve_result.population_selected,
-            total_population=dissolve_result.total_population,
-            area_sqm=dissolve_result.total_area_sqm,
-            num_parts=dissolve_result.num_parts,
-            total_area_all_sqm=total_area_all_sqm,
+    def export_one(lambda_val: float) -> ExportResult:
+        return export_lambda(
+            lambda_val,
+            simplify_results[lambda_val],
+            dissolve_results[lambda_val],
+            sweep_result,
+            output_dir=output_dir,
         )
 
-        output_path = output_dir / f"lambda_{lambda_val:.2f}.json"
-        result = export_to_topojson(
-            geometry=simplify_result.geometry,
-            output_path=output_path,
-            metadata=metadata,
-        )
-        results[lambda_val] = result
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outputs = executor.map(export_one, simplify_results)
+        for lambda_val, result in zip(simplify_results, outputs):
+            results[lambda_val] = result
 
-        if verbose:
-            size_kb = result.file_size_bytes / 1024
-            print(f"  → {result.path.name} ({size_kb:.1f} KB)")
+            if verbose:
+                size_kb = result.file_size_bytes / 1024
+                print(
+                    f"Exported λ={lambda_val:.2f} → {result.path.name} "
+                    f"({size_kb:.1f} KB)"
+                )
 
     return results
 
@@ -192,12 +237,18 @@ def export_combined_topojson(
     if output_path is None:
         output_path = TOPOJSON_DIR / "combined.json"
 
+    lambda_values = sorted(simplify_results.keys())
+
+    # Transform every lambda's geometry to WGS84 in one batch
+    geometries_wgs84 = gpd.GeoSeries(
+        [simplify_results[lam].geometry for lam in lambda_values], crs="EPSG:5070"
+    ).to_crs("EPSG:4326")
+
     # Build list of GeoDataFrames with object names
     gdfs = []
     object_names = []
 
-    for lambda_val in sorted(simplify_results.keys()):
-        simplify_result = simplify_results[lambda_val]
+    for lambda_val, geometry in zip(lambda_values, geometries_wgs84):
         dissolve_result = dissolve_results[lambda_val]
 
         # Get total area from sweep result
@@ -212,12 +263,11 @@ def export_combined_topojson(
                 "area_sqm": [dissolve_result.total_area_sqm],
                 "num_parts": [dissolve_result.num_parts],
                 "total_area_all_sqm": [total_area_all_sqm],
-                "geometry": [simplify_result.geometry],
+                "geometry": [geometry],
             },
-            crs="EPSG:5070",
+            crs="EPSG:4326",
         )
-        gdf_wgs84 = gdf.to_crs("EPSG:4326")
-        gdfs.append(gdf_wgs84)
+        gdfs.append(gdf)
         object_names.append(f"lambda_{lambda_val:.2f}")
 
     if verbose:
@@ -231,11 +281,7 @@ def export_combined_topojson(
         object_name=object_names,
     )
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to file
-    topo.to_json(str(output_path))
+    _write_topojson(topo, output_path)
 
     if verbose:
         size_kb = output_path.stat().st_size / 1024
@@ -1,5 +1,6 @@
 """Geometry simplification for web performance."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 import shapely
@@ -82,6 +83,7 @@ def simplify_all_lambdas(
     dissolve_results: dict[float, DissolveResult],
     tolerance: float = DEFAULT_TOLERANCE,
     verbose: bool = True,
+    max_workers: int = 1,
 ) -> dict[float, SimplifyResult]:
     """
     Simplify dissolved geometries for all lambda values.
@@ -94,6 +96,8 @@ def simplify_all_lambdas(
         Simplification tolerance in CRS units (meters for EPSG:5070)
     verbose : bool
         Print progress messages
+    max_workers : int
+        Lambda values simplified concurrently (Shapely releases the GIL)
 
     Returns
     -------
@@ -107,17 +111,21 @@ def simplify_all_lambdas(
     """
     results: dict[float, SimplifyResult] = {}
 
-    for lambda_val, dissolve_result in dissolve_results.items():
-        if verbose:
-            print(f"Simplifying λ={lambda_val:.2f}...")
-
-        result = simplify_geometry(dissolve_result.geometry, tolerance=tolerance)
-        results[lambda_val] = result
-
-        if verbose:
-            orig = result.original_vertex_count
-            simp = result.simplified_vertex_count
-            pct = result.reduction_percent
-            print(f"  {orig:,} → {simp:,} vertices ({pct:.1f}% reduction)")
+    def simplify_one(dissolve_result: DissolveResult) -> SimplifyResult:
+        return simplify_geometry(dissolve_result.geometry, tolerance=tolerance)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outputs = executor.map(simplify_one, dissolve_results.values())
+        for lambda_val, result in zip(dissolve_results, outputs):
+            results[lambda_val] = result
+
+            if verbose:
+                orig = result.original_vertex_count
+                simp = result.simplified_vertex_count
+                pct = result.reduction_percent
+                print(
+                    f"Simplified λ={lambda_val:.2f}: {orig:,} → {simp:,} vertices "
+                    f"({pct:.1f}% reduction)"
+                )
 
     return results
@@ -5,42 +5,133 @@ to produce meaningful performance measurements.
 """
 
 import gc
+import hashlib
+from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pytest
+import shapely
 from shapely import box
 
-from half_america.graph.adjacency import build_adjacency
-from half_america.graph.boundary import compute_graph_attributes
-from half_america.graph.pipeline import GraphData
-
-
-def build_graph_data(gdf: gpd.GeoDataFrame) -> GraphData:
-    """Build GraphData from GeoDataFrame without caching.
-
-    This is a simplified version of load_graph_data for benchmarks.
+from half_america.graph import (
+    GraphData,
+    adjacency,
+    boundary,
+    build_adjacency,
+    compute_graph_attributes,
+    pipeline,
+    read_graph_data,
+    save_graph_data,
+)
+
+# Modules whose code determines the built graph; their source is part of
+# the cache key so edits invalidate cached benchmark graphs
+_GRAPH_BUILD_MODULES = (adjacency, boundary, pipeline)
+
+
+def _gdf_cache_key(gdf: gpd.GeoDataFrame) -> str:
+    """Hash a benchmark grid together with the graph-building code."""
+    h = hashlib.blake2b(digest_size=16)
+    for module in _GRAPH_BUILD_MODULES:
+        h.update(Path(module.__file__).read_bytes())
+    for array in (
+        shapely.get_coordinates(gdf.geometry.values),
+        gdf["population"].to_numpy(),
+        gdf["area_sqm"].to_numpy(),
+    ):
+        h.update(np.ascontiguousarray(array).tobytes())
+    return h.hexdigest()
+
+
+def build_graph_data(gdf: gpd.GeoDataFrame, cache_dir: Path | None = None) -> GraphData:
+    """Build GraphData from GeoDataFrame, optionally cached on disk.
+
+    This is a simplified version of load_graph_data for benchmarks. With
+    a cache_dir, results are stored as .npz keyed on a hash of the input
+    grid and the graph-building source, so repeated pytest runs skip
+    adjacency and boundary building until either changes.
     """
+    path = None
+    if cache_dir is not None:
+        path = cache_dir / f"graph_{_gdf_cache_key(gdf)}.npz"
+        if path.exists():
+            return read_graph_data(path)
+
     adj_result = build_adjacency(gdf, verbose=False)
     attributes = compute_graph_attributes(gdf, adj_result.edges, verbose=False)
-    return GraphData(
+    graph_data = GraphData(
         edges=adj_result.edges,
         attributes=attributes,
         num_nodes=adj_result.num_nodes,
         num_edges=adj_result.num_edges,
     )
+    if path is not None:
+        save_graph_data(graph_data, path)
+    return graph_data
+
+
+def _density_grid(size: int) -> gpd.GeoDataFrame:
+    """Build a size x size grid of 1km squares with a density gradient.
+
+    Cells are generated with one vectorized shapely.box call. Area grows
+    with Manhattan distance from the center (factor 1.0 to ~2.0) and
+    population with (1 + row) * (1 + col).
+    """
+    base_cell_size = 1000  # 1km base cells
+    row, col = np.divmod(np.arange(size * size), size)
+
+    # Vary cell size: center cells are smaller (denser)
+    center = (size - 1) / 2
+    dist_from_center = np.abs(row - center) + np.abs(col - center)
+    size_factor = 1.0 + dist_from_center / size
+
+    x0 = col * base_cell_size
+    y0 = row * base_cell_size
+    return gpd.GeoDataFrame(
+        {
+            # Vary population to create interesting optimization landscape
+            "population": 1000 * (1 + row) * (1 + col),
+            # Area varies with size_factor squared
+            "area_sqm": (base_cell_size * size_factor) ** 2,
+            "geometry": box(x0, y0, x0 + base_cell_size, y0 + base_cell_size),
+        },
+        crs="EPSG:5070",
+    )
 
 
 @pytest.fixture
 def benchmark_setup(benchmark):
-    """Configure benchmark to disable GC during measurement."""
+    """Configure benchmark to suppress automatic GC during measurement.
+
+    Objects alive at setup (grids, GraphData) are frozen into the permanent
+    generation so collections never rescan them, and a zero threshold stops
+    automatic collection without disabling the collector outright.
+    """
     benchmark.extra_info["gc_disabled"] = True
     gc.collect()
-    gc.disable()
+    gc.freeze()
+    old_threshold = gc.get_threshold()
+    gc.set_threshold(0)
     yield
-    gc.enable()
+    gc.set_threshold(*old_threshold)
+    gc.unfreeze()
+
+
+@pytest.fixture(scope="session")
+def graph_cache_dir(request) -> Path | None:
+    """Directory for cached benchmark graphs inside the pytest cache.
+
+    Cleared by ``pytest --cache-clear``. Returns None (no caching) when
+    the cache plugin is disabled.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return None
+    return Path(cache.mkdir("half_america_graphs"))
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def grid_20x20_gdf() -> gpd.GeoDataFrame:
     """Create a 20x20 grid of adjacent squares for benchmarking.
 
@@ -55,51 +146,20 @@ def grid_20x20_gdf() -> gpd.GeoDataFrame:
     Returns:
         GeoDataFrame with 400 square polygons in EPSG:5070
     """
-    rows, cols = 20, 20
-    base_cell_size = 1000  # 1km base cells
-
-    geometries = []
-    populations = []
-    areas = []
-
-    for row in range(rows):
-        for col in range(cols):
-            # Vary cell size: center cells are smaller (denser)
-            dist_from_center = abs(row - 9.5) + abs(col - 9.5)
-            size_factor = 1.0 + dist_from_center / 20  # 1.0 to ~2.0
-            cell_size = base_cell_size * size_factor
-
-            x0 = col * base_cell_size
-            y0 = row * base_cell_size
-            geom = box(x0, y0, x0 + base_cell_size, y0 + base_cell_size)
-            geometries.append(geom)
-            # Vary population to create interesting optimization landscape
-            populations.append(1000 * (1 + row) * (1 + col))
-            # Area varies with size_factor squared
-            areas.append((cell_size) ** 2)
-
-    gdf = gpd.GeoDataFrame(
-        {
-            "population": populations,
-            "area_sqm": areas,
-            "geometry": geometries,
-        },
-        crs="EPSG:5070",
-    )
-    return gdf
+    return _density_grid(20)
 
 
-@pytest.fixture(scope="module")
-def benchmark_graph_data(grid_20x20_gdf) -> GraphData:
+@pytest.fixture(scope="session")
+def benchmark_graph_data(grid_20x20_gdf, graph_cache_dir) -> GraphData:
     """Build GraphData from 20x20 grid for benchmarking.
 
-    This fixture is module-scoped to avoid rebuilding the graph
-    for each benchmark iteration.
+    This fixture is session-scoped so every benchmark module and
+    iteration shares one graph instead of rebuilding it.
     """
-    return build_graph_data(grid_20x20_gdf)
+    return build_graph_data(grid_20x20_gdf, graph_cache_dir)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def grid_50x50_gdf() -> gpd.GeoDataFrame:
     """Create a 50x50 grid for larger-scale benchmarks.
 
@@ -113,39 +173,10 @@ def grid_50x50_gdf() -> gpd.GeoDataFrame:
     Returns:
         GeoDataFrame with 2,500 square polygons in EPSG:5070
     """
-    rows, cols = 50, 50
-    base_cell_size = 1000
-
-    geometries = []
-    populations = []
-    areas = []
-
-    for row in range(rows):
-        for col in range(cols):
-            # Vary cell size: center cells are smaller (denser)
-            dist_from_center = abs(row - 24.5) + abs(col - 24.5)
-            size_factor = 1.0 + dist_from_center / 50  # 1.0 to ~2.0
-            cell_size = base_cell_size * size_factor
-
-            x0 = col * base_cell_size
-            y0 = row * base_cell_size
-            geom = box(x0, y0, x0 + base_cell_size, y0 + base_cell_size)
-            geometries.append(geom)
-            populations.append(1000 * (1 + row) * (1 + col))
-            areas.append((cell_size) ** 2)
-
-    gdf = gpd.GeoDataFrame(
-        {
-            "population": populations,
-            "area_sqm": areas,
-            "geometry": geometries,
-        },
-        crs="EPSG:5070",
-    )
-    return gdf
+    return _density_grid(50)
 
 
-@pytest.fixture(scope="module")
-def large_graph_data(grid_50x50_gdf) -> GraphData:
+@pytest.fixture(scope="session")
+def large_graph_data(grid_50x50_gdf, graph_cache_dir) -> GraphData:
     """Build GraphData from 50x50 grid for scaling benchmarks."""
-    return build_graph_data(grid_50x50_gdf)
+    return build_graph_data(grid_50x50_gdf, graph_cache_dir)
@@ -1,8 +1,44 @@
 """Benchmarks for flow network construction."""
 
+import numpy as np
+import pytest
+from scipy.sparse import csr_array
+from scipy.sparse.csgraph import maximum_flow
+
+from half_america.graph.boundary import GraphAttributes
 from half_america.graph.network import build_flow_network, get_partition
 
 
+def _build_dinic_network(
+    attributes: GraphAttributes,
+    edges: np.ndarray,
+    lambda_param: float,
+    mu: float,
+    max_capacity: int = 2**24,
+) -> tuple[csr_array, int, int, float]:
+    """Build the same s-t network as a CSR matrix for scipy's Dinic solver.
+
+    scipy.sparse.csgraph.maximum_flow requires integer capacities, so all
+    capacities are scaled to at most max_capacity and rounded. Node n is
+    the source and n + 1 the sink; the scale factor is returned so flows
+    can be compared with PyMaxFlow's.
+    """
+    n = len(attributes.population)
+    source_caps = mu * attributes.population
+    sink_caps = ((1 - lambda_param) / attributes.rho**2) * attributes.area
+    n_caps = (lambda_param / attributes.rho) * attributes.edge_lengths
+    scale = max_capacity / max(source_caps.max(), sink_caps.max(), n_caps.max())
+
+    nodes = np.arange(n)
+    rows = np.concatenate([edges[:, 0], edges[:, 1], np.full(n, n), nodes])
+    cols = np.concatenate([edges[:, 1], edges[:, 0], nodes, np.full(n, n + 1)])
+    caps = np.concatenate([n_caps, n_caps, source_caps, sink_caps]) * scale
+    network = csr_array(
+        (np.rint(caps).astype(np.int32), (rows, cols)), shape=(n + 2, n + 2)
+    )
+    return network, n, n + 1, scale
+
+
 class TestBuildFlowNetworkBench:
     """Benchmarks for build_flow_network()."""
 
@@ -39,35 +75,71 @@ class TestMaxflowSolveBench:
     def test_maxflow_solve_20x20(self, benchmark, benchmark_graph_data):
         """Benchmark maxflow solve on 20x20 grid."""
 
-        def solve():
-            # Must rebuild graph each time - PyMaxFlow graphs are single-use
+        def setup():
+            # PyMaxFlow graphs are single-use, so build a fresh one per round
+            # outside the timed region
             g = build_flow_network(
                 benchmark_graph_data.attributes,
                 benchmark_graph_data.edges,
                 lambda_param=0.5,
                 mu=0.001,
             )
-            return g.maxflow()
+            return (g,), {}
 
-        result = benchmark(solve)
+        result = benchmark.pedantic(
+            lambda g: g.maxflow(), setup=setup, rounds=50, iterations=1, warmup_rounds=2
+        )
         assert result >= 0
 
     def test_maxflow_solve_50x50(self, benchmark, large_graph_data):
         """Benchmark maxflow solve on 50x50 grid."""
 
-        def solve():
+        def setup():
             g = build_flow_network(
                 large_graph_data.attributes,
                 large_graph_data.edges,
                 lambda_param=0.5,
                 mu=0.001,
             )
-            return g.maxflow()
+            return (g,), {}
 
-        result = benchmark(solve)
+        result = benchmark.pedantic(
+            lambda g: g.maxflow(), setup=setup, rounds=20, iterations=1, warmup_rounds=2
+        )
         assert result >= 0
 
 
+class TestScipyDinicBench:
+    """Reference benchmark of scipy's Dinic solver on the same network.
+
+    Kept for comparison with TestMaxflowSolveBench; Boykov-Kolmogorov in
+    PyMaxFlow remains the production solver.
+    """
+
+    def test_dinic_solve_50x50(self, benchmark, large_graph_data):
+        """Benchmark scipy Dinic maxflow on 50x50 grid."""
+        network, source, sink, scale = _build_dinic_network(
+            large_graph_data.attributes,
+            large_graph_data.edges,
+            lambda_param=0.5,
+            mu=0.001,
+        )
+
+        result = benchmark(maximum_flow, network, source, sink, method="dinic")
+
+        g = build_flow_network(
+            large_graph_data.attributes,
+            large_graph_data.edges,
+            lambda_param=0.5,
+            mu=0.001,
+        )
+        # Each rounded capacity is off by at most 0.5 scaled units, which
+        # bounds how far the integer min cut can drift from the float one
+        assert result.flow_value / scale == pytest.approx(
+            g.maxflow(), abs=0.5 * network.nnz / scale
+        )
+
+
 class TestGetPartitionBench:
     """Benchmarks for partition extraction."""
 
@@ -3,21 +3,23 @@
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pytest
-from shapely.geometry import Polygon, box
+from shapely import box
+from shapely.geometry import Polygon
 
 # Use realistic US coordinates (around DC area) for EPSG:4326 -> EPSG:5070 reprojection
 # DC is approximately at (-77.0, 38.9)
 DC_LON, DC_LAT = -77.0, 38.9
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_polygon() -> Polygon:
     """Create a simple valid polygon in US coordinates."""
     return box(DC_LON, DC_LAT, DC_LON + 0.01, DC_LAT + 0.01)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_polygon() -> Polygon:
     """Create a self-intersecting (bowtie) polygon in US coordinates."""
     # Bowtie shape - self-intersecting
@@ -34,30 +36,32 @@ def invalid_polygon() -> Polygon:
 
 @pytest.fixture
 def sample_gdf(sample_polygon) -> gpd.GeoDataFrame:
-    """Create a simple GeoDataFrame with valid geometries in US coordinates."""
+    """Create a simple GeoDataFrame with valid geometries in US coordinates.
+
+    Function-scoped because tests mutate the frame (e.g. clearing its CRS);
+    the three cells are built in one vectorized box call.
+    """
+    x0 = DC_LON + np.array([0.0, 0.01, 0.0])
+    y0 = DC_LAT + np.array([0.0, 0.0, 0.01])
     return gpd.GeoDataFrame(
         {
             "GEOID": ["001", "002", "003"],
             "NAME": ["Tract 1", "Tract 2", "Tract 3"],
-            "geometry": [
-                box(DC_LON, DC_LAT, DC_LON + 0.01, DC_LAT + 0.01),
-                box(DC_LON + 0.01, DC_LAT, DC_LON + 0.02, DC_LAT + 0.01),
-                box(DC_LON, DC_LAT + 0.01, DC_LON + 0.01, DC_LAT + 0.02),
-            ],
+            "geometry": box(x0, y0, x0 + 0.01, y0 + 0.01),
         },
         crs="EPSG:4326",
     )
 
 
 @pytest.fixture
-def gdf_with_invalid(invalid_polygon) -> gpd.GeoDataFrame:
+def gdf_with_invalid(sample_polygon, invalid_polygon) -> gpd.GeoDataFrame:
     """Create a GeoDataFrame with one invalid geometry."""
     return gpd.GeoDataFrame(
         {
             "GEOID": ["001", "002"],
             "NAME": ["Valid", "Invalid"],
             "geometry": [
-                box(DC_LON, DC_LAT, DC_LON + 0.01, DC_LAT + 0.01),
+                sample_polygon,
                 invalid_polygon,
             ],
         },
@@ -66,14 +70,14 @@ def gdf_with_invalid(invalid_polygon) -> gpd.GeoDataFrame:
 
 
 @pytest.fixture
-def gdf_with_null() -> gpd.GeoDataFrame:
+def gdf_with_null(sample_polygon) -> gpd.GeoDataFrame:
     """Create a GeoDataFrame with null geometries."""
     return gpd.GeoDataFrame(
         {
             "GEOID": ["001", "002", "003"],
             "NAME": ["Valid", "Null", "Empty"],
             "geometry": [
-                box(DC_LON, DC_LAT, DC_LON + 0.01, DC_LAT + 0.01),
+                sample_polygon,
                 None,
                 Polygon(),
             ],
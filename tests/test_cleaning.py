@@ -1,6 +1,7 @@
 """Tests for geometry cleaning functions."""
 
 import pytest
+import shapely
 
 from half_america.data.cleaning import (
     clean_census_tracts,
@@ -103,3 +104,17 @@ class TestCleanCensusTracts:
 
         assert result.is_valid.all()
         assert stats.invalid_fixed == 1
+
+    def test_pipeline_normalize_optional(self, sample_gdf):
+        """Test that normalization only runs when requested."""
+        result, _ = clean_census_tracts(sample_gdf, verbose=False, normalize=True)
+
+        normalized = shapely.normalize(result.geometry.values)
+        assert shapely.equals_exact(result.geometry.values, normalized, 0).all()
+
+        # Default: box() rings start at (maxx, miny), unlike normalized rings
+        default, _ = clean_census_tracts(sample_gdf, verbose=False)
+
+        normalized = shapely.normalize(default.geometry.values)
+        assert not shapely.equals_exact(default.geometry.values, normalized, 0).any()
+        assert shapely.equals(default.geometry.values, normalized).all()
@@ -0,0 +1,24 @@
+"""Tests for command-line helpers."""
+
+import pytest
+
+from half_america.cli import lambda_grid
+
+
+class TestLambdaGrid:
+    def test_default_grid(self):
+        """Test the default 0.1 step up to 0.99."""
+        assert lambda_grid(0.1, 0.99) == [
+            0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9
+        ]  # fmt: skip
+
+    @pytest.mark.parametrize(
+        ("lambda_step", "lambda_max"),
+        [(0.03, 0.9), (0.1, 0.9), (0.05, 0.95), (0.01, 0.99)],
+    )
+    def test_excludes_upper_bound(self, lambda_step, lambda_max):
+        """Test that lambda_max is excluded even when float steps overshoot."""
+        values = lambda_grid(lambda_step, lambda_max)
+
+        assert max(values) < lambda_max
+        assert len(values) == round(lambda_max / lambda_step)
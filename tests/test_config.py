@@ -0,0 +1,20 @@
+"""Tests for configuration parsing."""
+
+import pytest
+
+from half_america.config import _parse_workers
+
+
+class TestParseWorkers:
+    @pytest.mark.parametrize(
+        ("value", "expected"), [(None, None), ("", None), ("4", 4)]
+    )
+    def test_valid_values(self, value, expected):
+        """Test that unset and positive values parse as expected."""
+        assert _parse_workers(value) == expected
+
+    @pytest.mark.parametrize("value", ["four", "2.5", "0", "-1"])
+    def test_invalid_values_fall_back(self, value):
+        """Test that malformed or non-positive values warn and use the default."""
+        with pytest.warns(UserWarning, match="HALF_AMERICA_WORKERS"):
+            assert _parse_workers(value) is None
@@ -0,0 +1,59 @@
+"""Tests for DataFrame assembly utilities."""
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+from half_america.data.frames import concat_frames
+
+
+class TestConcatFrames:
+    def test_matches_pd_concat(self, sample_gdf, gdf_with_invalid):
+        """Test that GeoDataFrames concatenate like pd.concat."""
+        frames = [sample_gdf, gdf_with_invalid]
+        result = concat_frames(frames)
+        expected = gpd.GeoDataFrame(
+            pd.concat(frames, ignore_index=True), crs=sample_gdf.crs
+        )
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert result.crs == sample_gdf.crs
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_plain_dataframes(self):
+        """Test that non-geometry frames stay plain DataFrames."""
+        frames = [
+            pd.DataFrame({"GEOID": ["001", "002"], "population": [10, 20]}),
+            pd.DataFrame({"GEOID": ["003"], "population": [30]}),
+        ]
+        result = concat_frames(frames)
+
+        assert not isinstance(result, gpd.GeoDataFrame)
+        pd.testing.assert_frame_equal(result, pd.concat(frames, ignore_index=True))
+
+    def test_mixed_dtypes_upcast(self):
+        """Test that a column's dtype changing between frames is upcast, not cast."""
+        frames = [
+            pd.DataFrame({"population": [10, 20]}),
+            pd.DataFrame({"population": [2.7, float("nan")]}),
+        ]
+        result = concat_frames(frames)
+
+        assert result["population"].dtype == float
+        pd.testing.assert_frame_equal(result, pd.concat(frames, ignore_index=True))
+
+    def test_mismatched_columns(self, sample_gdf):
+        """Test that frames with different columns keep every column."""
+        extra = sample_gdf.assign(ALAND=1.0)
+        result = concat_frames([sample_gdf, extra])
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert result.crs == sample_gdf.crs
+        assert list(result.columns) == list(extra.columns)
+        assert result["ALAND"].isna().sum() == len(sample_gdf)
+        assert len(result) == 2 * len(sample_gdf)
+
+    def test_empty_input_raises(self):
+        """Test that an empty sequence raises a clear error."""
+        with pytest.raises(ValueError, match="No frames"):
+            concat_frames([])
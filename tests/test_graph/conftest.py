@@ -1,9 +1,12 @@
 """Pytest fixtures for graph tests."""
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
-from shapely.geometry import box
+from shapely import box
+
+from half_america.graph.pipeline import GraphData, load_graph_data
 
 # Create a 3x3 grid of adjacent squares for testing
 # Each square is 1000m x 1000m in EPSG:5070 coordinates
@@ -12,36 +15,37 @@ GRID_ORIGIN_Y = 0
 GRID_SIZE = 1000  # meters
 
 
-@pytest.fixture
-def grid_3x3_gdf() -> gpd.GeoDataFrame:
-    """Create a 3x3 grid of adjacent squares for testing adjacency."""
-    geometries = []
-    geoids = []
-    populations = []
-
-    for row in range(3):
-        for col in range(3):
-            x0 = GRID_ORIGIN_X + col * GRID_SIZE
-            y0 = GRID_ORIGIN_Y + row * GRID_SIZE
-            x1 = x0 + GRID_SIZE
-            y1 = y0 + GRID_SIZE
-            geometries.append(box(x0, y0, x1, y1))
-            geoids.append(f"{row}{col}")
-            # Population varies by position (center has most)
-            populations.append(1000 * (1 + row) * (1 + col))
+def _grid_3x3_gdf() -> gpd.GeoDataFrame:
+    """Build a 3x3 grid of 1km squares with population growing with position."""
+    row, col = np.divmod(np.arange(9), 3)
+    x0 = GRID_ORIGIN_X + col * GRID_SIZE
+    y0 = GRID_ORIGIN_Y + row * GRID_SIZE
 
     gdf = gpd.GeoDataFrame(
         {
-            "GEOID": geoids,
-            "population": populations,
-            "geometry": geometries,
+            "GEOID": [f"{r}{c}" for r, c in zip(row, col)],
+            # Population varies by position (center has most)
+            "population": 1000 * (1 + row) * (1 + col),
+            "geometry": box(x0, y0, x0 + GRID_SIZE, y0 + GRID_SIZE),
+            "area_sqm": np.full(9, float(GRID_SIZE * GRID_SIZE)),
         },
         crs="EPSG:5070",
     )
-    gdf["area_sqm"] = gdf.geometry.area
     return gdf
 
 
+@pytest.fixture
+def grid_3x3_gdf() -> gpd.GeoDataFrame:
+    """Create a 3x3 grid of adjacent squares for testing adjacency."""
+    return _grid_3x3_gdf()
+
+
+@pytest.fixture(scope="session")
+def grid_3x3_graph_data() -> GraphData:
+    """Build GraphData for the 3x3 grid once for all read-only tests."""
+    return load_graph_data(_grid_3x3_gdf(), use_cache=False, verbose=False)
+
+
 @pytest.fixture
 def grid_with_island_gdf(grid_3x3_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """Create a 3x3 grid plus one isolated square (island)."""
@@ -50,10 +54,10 @@ def grid_with_island_gdf(grid_3x3_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
             "GEOID": ["island"],
             "population": [500],
             "geometry": [box(10000, 10000, 11000, 11000)],  # Far away
+            "area_sqm": [float(GRID_SIZE * GRID_SIZE)],
         },
         crs="EPSG:5070",
     )
-    island["area_sqm"] = island.geometry.area
 
     return gpd.GeoDataFrame(
         pd.concat([grid_3x3_gdf, island], ignore_index=True),
@@ -1,5 +1,10 @@
 """Tests for adjacency graph construction."""
 
+import geopandas as gpd
+import numpy as np
+import shapely
+from libpysal.weights import Queen
+
 from half_america.graph.adjacency import build_adjacency
 
 
@@ -20,7 +25,8 @@ class TestBuildAdjacency:
         assert result.num_nodes == 10
         assert result.num_islands_attached == 1
         # Island should now have at least one neighbor
-        assert result.weights.islands == []
+        assert (np.diff(result.adjacency.indptr) > 0).all()
+        assert result.num_components == 1
 
     def test_edges_are_unique(self, grid_3x3_gdf):
         """Test that edge list contains only unique pairs (i < j)."""
@@ -30,12 +36,37 @@ class TestBuildAdjacency:
             assert i < j, f"Edge ({i}, {j}) should have i < j"
 
         # No duplicates
-        assert len(result.edges) == len(set(result.edges))
+        assert len(result.edges) == len(set(map(tuple, result.edges.tolist())))
+
+    def test_edge_columns_are_contiguous(self, grid_3x3_gdf):
+        """Test that src/dst columns can be used without copying."""
+        result = build_adjacency(grid_3x3_gdf, verbose=False)
+
+        assert result.edges.dtype == np.int32
+        assert result.edges[:, 0].flags.c_contiguous
+        assert result.edges[:, 1].flags.c_contiguous
 
     def test_center_has_most_neighbors(self, grid_3x3_gdf):
         """Test that center cell has 8 neighbors (Queen contiguity)."""
         result = build_adjacency(grid_3x3_gdf, verbose=False)
 
         # Center is index 4 in row-major order
-        center_neighbors = result.weights.neighbors[4]
+        indptr, indices = result.adjacency.indptr, result.adjacency.indices
+        center_neighbors = indices[indptr[4] : indptr[5]]
         assert len(center_neighbors) == 8
+
+    def test_matches_libpysal_queen(self):
+        """Test that vertex-hash edges match libpysal Queen on irregular tiles."""
+        rng = np.random.default_rng(0)
+        points = shapely.multipoints(rng.uniform(0, 10000, (200, 2)))
+        cells = shapely.get_parts(shapely.voronoi_polygons(points))
+        cells = shapely.set_precision(
+            shapely.intersection(cells, shapely.box(0, 0, 10000, 10000)), 1.0
+        )
+        gdf = gpd.GeoDataFrame(geometry=cells, crs="EPSG:5070")
+
+        result = build_adjacency(gdf, verbose=False)
+        w = Queen.from_dataframe(gdf, use_index=False, silence_warnings=True)
+        expected = {(i, j) for i, nbrs in w.neighbors.items() for j in nbrs if i < j}
+
+        assert set(map(tuple, result.edges.tolist())) == expected
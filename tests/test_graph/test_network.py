@@ -4,7 +4,11 @@ import numpy as np
 import pytest
 
 from half_america.graph.boundary import GraphAttributes
-from half_america.graph.network import build_flow_network, get_partition
+from half_america.graph.network import (
+    build_flow_network,
+    compute_energy,
+    get_partition,
+)
 
 
 @pytest.fixture
@@ -14,14 +18,14 @@ def simple_attributes():
         population=np.array([100, 200, 300]),
         area=np.array([1000.0, 1000.0, 1000.0]),
         rho=100.0,
-        edge_lengths={(0, 1): 50.0, (1, 0): 50.0, (1, 2): 50.0, (2, 1): 50.0},
+        edge_lengths=np.array([50.0, 50.0]),
     )
 
 
 class TestBuildFlowNetwork:
     def test_creates_graph(self, simple_attributes):
         """Test that a graph is created."""
-        edges = [(0, 1), (1, 2)]
+        edges = np.array([(0, 1), (1, 2)])
         g = build_flow_network(simple_attributes, edges, lambda_param=0.5, mu=0.01)
 
         # Should be able to call maxflow without error
@@ -30,7 +34,7 @@ class TestBuildFlowNetwork:
 
     def test_high_mu_selects_all(self, simple_attributes):
         """Test that high mu (population reward) selects all nodes."""
-        edges = [(0, 1), (1, 2)]
+        edges = np.array([(0, 1), (1, 2)])
         g = build_flow_network(simple_attributes, edges, lambda_param=0.5, mu=1000.0)
         g.maxflow()
 
@@ -40,7 +44,7 @@ class TestBuildFlowNetwork:
 
     def test_zero_mu_selects_none(self, simple_attributes):
         """Test that zero mu (no population reward) selects no nodes."""
-        edges = [(0, 1), (1, 2)]
+        edges = np.array([(0, 1), (1, 2)])
         g = build_flow_network(simple_attributes, edges, lambda_param=0.5, mu=0.0)
         g.maxflow()
 
@@ -48,11 +52,25 @@ class TestBuildFlowNetwork:
         # With zero mu, area cost dominates -> no nodes selected
         assert not partition.any()
 
+    def test_skips_zero_length_edges(self):
+        """Test that corner-only neighbors add no n-links to the network."""
+        attributes = GraphAttributes(
+            population=np.array([100, 200, 300]),
+            area=np.array([1000.0, 1000.0, 1000.0]),
+            rho=100.0,
+            edge_lengths=np.array([50.0, 0.0, 50.0]),
+        )
+        edges = np.array([(0, 1), (0, 2), (1, 2)])
+        g = build_flow_network(attributes, edges, lambda_param=0.5, mu=0.01)
+
+        # Each symmetric n-link is one edge pair in PyMaxFlow
+        assert g.get_edge_count() == 2 * 2
+
 
 class TestGetPartition:
     def test_returns_boolean_array(self, simple_attributes):
         """Test partition extraction returns correct format."""
-        edges = [(0, 1), (1, 2)]
+        edges = np.array([(0, 1), (1, 2)])
         g = build_flow_network(simple_attributes, edges, lambda_param=0.5, mu=0.01)
         g.maxflow()
 
@@ -60,3 +78,30 @@ class TestGetPartition:
 
         assert partition.dtype == bool
         assert len(partition) == 3
+
+
+class TestComputeEnergy:
+    def test_matches_per_edge_sum(self):
+        """Test vectorized energy against an explicit per-edge sum."""
+        rng = np.random.default_rng(0)
+        n = 50
+        edges = np.array([(i, j) for i in range(n) for j in range(i + 1, n, 7)])
+        attributes = GraphAttributes(
+            population=rng.integers(0, 5000, n),
+            area=rng.uniform(1e5, 1e7, n),
+            rho=1500.0,
+            edge_lengths=rng.uniform(0, 2000, len(edges)),
+        )
+        partition = rng.random(n) < 0.5
+        lam, mu = 0.3, 0.002
+
+        expected = sum(
+            lam * l_ij / attributes.rho
+            for (i, j), l_ij in zip(edges, attributes.edge_lengths)
+            if partition[i] != partition[j]
+        )
+        expected += (1 - lam) * attributes.area[partition].sum() / attributes.rho**2
+        expected -= mu * attributes.population[partition].sum()
+
+        energy = compute_energy(attributes, edges, partition, lam, mu)
+        assert energy == pytest.approx(expected)
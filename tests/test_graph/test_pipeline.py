@@ -1,8 +1,14 @@
 """Tests for graph data pipeline."""
 
+import numpy as np
 import pytest
 
-from half_america.graph.pipeline import get_graph_summary, load_graph_data
+from half_america.graph import pipeline
+from half_america.graph.pipeline import (
+    get_graph_fingerprint,
+    get_graph_summary,
+    load_graph_data,
+)
 
 
 class TestLoadGraphData:
@@ -15,23 +21,52 @@ class TestLoadGraphData:
         assert len(graph_data.edges) == 20
         assert graph_data.attributes.rho > 0
 
-    def test_graph_data_has_correct_attributes(self, grid_3x3_gdf):
+    def test_graph_data_has_correct_attributes(self, grid_3x3_graph_data):
         """Test that graph data attributes are correct."""
-        graph_data = load_graph_data(grid_3x3_gdf, use_cache=False, verbose=False)
-
-        attrs = graph_data.attributes
+        attrs = grid_3x3_graph_data.attributes
         assert len(attrs.population) == 9
         assert len(attrs.area) == 9
         assert attrs.rho == pytest.approx(1000.0, rel=0.01)
-        # Each edge has both directions stored
-        assert len(attrs.edge_lengths) == 40  # 20 edges * 2 directions
+        # One length per edge, aligned with graph_data.edges
+        assert len(attrs.edge_lengths) == 20
+
+    def test_cache_roundtrip(self, grid_3x3_gdf, tmp_path, monkeypatch):
+        """Test that cached graph data loads back identical arrays."""
+        cache_path = tmp_path / "graph.npz"
+        monkeypatch.setattr(pipeline, "_get_graph_cache_path", lambda: cache_path)
+
+        built = load_graph_data(grid_3x3_gdf, verbose=False)
+        assert cache_path.exists()
+        loaded = load_graph_data(grid_3x3_gdf, verbose=False)
+
+        assert loaded.num_nodes == built.num_nodes
+        assert loaded.num_edges == built.num_edges
+        np.testing.assert_array_equal(loaded.edges, built.edges)
+        attrs, expected = loaded.attributes, built.attributes
+        np.testing.assert_array_equal(attrs.population, expected.population)
+        np.testing.assert_array_equal(attrs.area, expected.area)
+        np.testing.assert_array_equal(attrs.edge_lengths, expected.edge_lengths)
+        assert attrs.rho == expected.rho
+        assert get_graph_fingerprint(loaded) == get_graph_fingerprint(built)
+
+
+class TestGetGraphFingerprint:
+    def test_changes_with_attributes(self, grid_3x3_graph_data):
+        """Test that any attribute change yields a different fingerprint."""
+        graph_data = grid_3x3_graph_data
+        attrs = graph_data.attributes
+        changed = graph_data._replace(
+            attributes=attrs._replace(population=attrs.population + 1)
+        )
+
+        assert get_graph_fingerprint(graph_data) == get_graph_fingerprint(graph_data)
+        assert get_graph_fingerprint(changed) != get_graph_fingerprint(graph_data)
 
 
 class TestGetGraphSummary:
-    def test_returns_summary_dict(self, grid_3x3_gdf):
+    def test_returns_summary_dict(self, grid_3x3_graph_data):
         """Test that summary statistics are computed."""
-        graph_data = load_graph_data(grid_3x3_gdf, use_cache=False, verbose=False)
-        summary = get_graph_summary(graph_data)
+        summary = get_graph_summary(grid_3x3_graph_data)
 
         assert summary["num_nodes"] == 9
         assert summary["num_edges"] == 20
@@ -10,60 +10,62 @@ import pytest
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def skip_without_api_key():
-    """Skip test if Census API key is not configured."""
+@pytest.fixture(scope="session")
+def census_api_key() -> str:
+    """Return the Census API key, skipping dependent tests if not configured."""
     from half_america.config import CENSUS_API_KEY
 
     if not CENSUS_API_KEY:
         pytest.skip("CENSUS_API_KEY not configured")
+    return CENSUS_API_KEY
 
 
-class TestTigerDownload:
-    def test_download_dc_tracts(self):
-        """Test downloading DC tracts (smallest state)."""
-        from half_america.data import download_state_tracts
+@pytest.fixture(scope="session")
+def dc_tracts_gdf():
+    """Download DC tracts (smallest state) once for the session."""
+    from half_america.data import download_state_tracts
 
-        gdf = download_state_tracts("11")
+    return download_state_tracts("11")
 
-        assert len(gdf) > 0
-        assert "GEOID" in gdf.columns
-        assert gdf.crs is not None
 
-    def test_dc_tract_count_reasonable(self):
-        """Test that DC has reasonable number of tracts."""
-        from half_america.data import download_state_tracts
+@pytest.fixture(scope="session")
+def dc_population_df(census_api_key):
+    """Fetch DC population once for the session."""
+    from half_america.data import fetch_state_population
 
-        gdf = download_state_tracts("11")
+    return fetch_state_population("11")
 
+
+class TestTigerDownload:
+    def test_download_dc_tracts(self, dc_tracts_gdf):
+        """Test downloading DC tracts (smallest state)."""
+        assert len(dc_tracts_gdf) > 0
+        assert "GEOID" in dc_tracts_gdf.columns
+        assert dc_tracts_gdf.crs is not None
+
+    def test_dc_tract_count_reasonable(self, dc_tracts_gdf):
+        """Test that DC has reasonable number of tracts."""
         # DC should have ~200 tracts
-        assert 150 < len(gdf) < 300
+        assert 150 < len(dc_tracts_gdf) < 300
 
 
 class TestCensusFetch:
-    def test_fetch_dc_population(self, skip_without_api_key):
+    def test_fetch_dc_population(self, dc_population_df):
         """Test fetching DC population data."""
-        from half_america.data import fetch_state_population
-
-        df = fetch_state_population("11")
+        assert len(dc_population_df) > 0
+        assert "GEOID" in dc_population_df.columns
+        assert "population" in dc_population_df.columns
 
-        assert len(df) > 0
-        assert "GEOID" in df.columns
-        assert "population" in df.columns
-
-    def test_dc_population_reasonable(self, skip_without_api_key):
+    def test_dc_population_reasonable(self, dc_population_df):
         """Test that DC population is reasonable."""
-        from half_america.data import fetch_state_population
-
-        df = fetch_state_population("11")
-        total_pop = df["population"].sum()
+        total_pop = dc_population_df["population"].sum()
 
         # DC population should be ~700k
         assert 600_000 < total_pop < 800_000
 
 
 class TestFullPipeline:
-    def test_load_dc_tracts(self, skip_without_api_key):
+    def test_load_dc_tracts(self, census_api_key):
         """Test loading DC tracts with full pipeline."""
         from half_america.data import get_pipeline_summary, load_state_tracts
 
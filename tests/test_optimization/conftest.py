@@ -7,24 +7,37 @@ from half_america.graph.boundary import GraphAttributes
 from half_america.graph.pipeline import GraphData
 
 
-@pytest.fixture
+def _read_only(graph_data: GraphData) -> GraphData:
+    """Lock the arrays of a shared fixture so no test can mutate them."""
+    for array in (graph_data.edges, *graph_data.attributes):
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+    return graph_data
+
+
+@pytest.fixture(scope="session")
 def simple_graph_data():
-    """Create minimal 3-node GraphData for testing."""
+    """Create minimal 3-node GraphData for testing.
+
+    Session-scoped and read-only: every test shares one instance.
+    """
     attributes = GraphAttributes(
         population=np.array([100, 200, 300]),
         area=np.array([1000.0, 1000.0, 1000.0]),
         rho=100.0,
-        edge_lengths={(0, 1): 50.0, (1, 0): 50.0, (1, 2): 50.0, (2, 1): 50.0},
+        edge_lengths=np.array([50.0, 50.0]),
     )
-    return GraphData(
-        edges=[(0, 1), (1, 2)],
-        attributes=attributes,
-        num_nodes=3,
-        num_edges=2,
+    return _read_only(
+        GraphData(
+            edges=np.array([(0, 1), (1, 2)]),
+            attributes=attributes,
+            num_nodes=3,
+            num_edges=2,
+        )
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_graph_data():
     """Create 5-node GraphData where 50% requires multiple nodes.
 
@@ -43,43 +56,34 @@ def complex_graph_data():
         population=np.array([80, 120, 150, 200, 250]),
         area=np.array([10000.0, 8000.0, 6000.0, 4000.0, 2000.0]),  # Dense to sparse
         rho=100.0,
-        edge_lengths={
-            (0, 1): 50.0,
-            (1, 0): 50.0,
-            (1, 2): 50.0,
-            (2, 1): 50.0,
-            (2, 3): 50.0,
-            (3, 2): 50.0,
-            (3, 4): 50.0,
-            (4, 3): 50.0,
-        },
+        edge_lengths=np.array([50.0, 50.0, 50.0, 50.0]),
     )
-    return GraphData(
-        edges=[(0, 1), (1, 2), (2, 3), (3, 4)],
-        attributes=attributes,
-        num_nodes=5,
-        num_edges=4,
+    return _read_only(
+        GraphData(
+            edges=np.array([(0, 1), (1, 2), (2, 3), (3, 4)]),
+            attributes=attributes,
+            num_nodes=5,
+            num_edges=4,
+        )
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tiny_graph_factory():
     """Factory to create tiny graphs for brute-force testing."""
 
     def _create(n: int) -> GraphData:
         """Create n-node linear chain graph."""
         # Generate populations that sum to nice numbers
-        populations = np.array([100 * (i + 1) for i in range(n)])
-        areas = np.array([1000.0] * n)
+        populations = 100 * np.arange(1, n + 1)
+        areas = np.full(n, 1000.0)
 
-        # Linear chain edges
-        edges = [(i, i + 1) for i in range(n - 1)]
+        # Linear chain edges (i, i + 1)
+        nodes = np.arange(n - 1)
+        edges = np.column_stack([nodes, nodes + 1])
 
         # Edge lengths all equal
-        edge_lengths = {}
-        for i, j in edges:
-            edge_lengths[(i, j)] = 50.0
-            edge_lengths[(j, i)] = 50.0
+        edge_lengths = np.full(len(edges), 50.0)
 
         attributes = GraphAttributes(
             population=populations,
@@ -87,11 +91,13 @@ def tiny_graph_factory():
             rho=100.0,
             edge_lengths=edge_lengths,
         )
-        return GraphData(
-            edges=edges,
-            attributes=attributes,
-            num_nodes=n,
-            num_edges=len(edges),
+        return _read_only(
+            GraphData(
+                edges=edges,
+                attributes=attributes,
+                num_nodes=n,
+                num_edges=len(edges),
+            )
         )
 
     return _create
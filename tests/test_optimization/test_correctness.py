@@ -1,14 +1,19 @@
 """Tests for mathematical correctness of optimization."""
 
-from itertools import product
-
 import numpy as np
 import pytest
 
 from half_america.graph.network import compute_energy
+from half_america.graph.pipeline import GraphData
 from half_america.optimization import solve_partition
 
 
+def _with_population(graph_data: GraphData, population: np.ndarray) -> GraphData:
+    """Reuse a fixture graph's shared arrays with a different population."""
+    attributes = graph_data.attributes._replace(population=population)
+    return graph_data._replace(attributes=attributes)
+
+
 class TestPartitionInvariants:
     """Tests verifying partition properties."""
 
@@ -68,25 +73,25 @@ class TestPartitionInvariants:
 
         assert computed_selected_pop == result.selected_population
 
-    def test_invariants_hold_for_various_mu(self, simple_graph_data):
+    # simple_graph_data selects nothing below μ ≈ 0.00025 and everything
+    # above it; one value per class plus an extreme magnitude
+    @pytest.mark.parametrize("mu", [0.0, 0.001, 10.0])
+    def test_invariants_hold_for_various_mu(self, simple_graph_data, mu):
         """Partition invariants hold across different mu values."""
-        for mu in [0.0, 0.001, 0.01, 0.1, 1.0, 10.0]:
-            result = solve_partition(
-                simple_graph_data,
-                lambda_param=0.5,
-                mu=mu,
-                verbose=False,
-            )
-            attrs = simple_graph_data.attributes
-            unselected_pop = int(attrs.population[~result.partition].sum())
-            unselected_area = float(attrs.area[~result.partition].sum())
+        result = solve_partition(
+            simple_graph_data,
+            lambda_param=0.5,
+            mu=mu,
+            verbose=False,
+        )
+        attrs = simple_graph_data.attributes
+        unselected_pop = int(attrs.population[~result.partition].sum())
+        unselected_area = float(attrs.area[~result.partition].sum())
 
-            assert (
-                result.selected_population + unselected_pop == result.total_population
-            )
-            assert result.selected_area + unselected_area == pytest.approx(
-                result.total_area
-            )
+        assert result.selected_population + unselected_pop == result.total_population
+        assert result.selected_area + unselected_area == pytest.approx(
+            result.total_area
+        )
 
 
 class TestEnergyFunction:
@@ -171,9 +176,8 @@ class TestEnergyFunction:
 
             # Boundary cost
             boundary_cost = 0.0
-            for i, j in simple_graph_data.edges:
+            for (i, j), l_ij in zip(simple_graph_data.edges, attrs.edge_lengths):
                 if partition[i] != partition[j]:
-                    l_ij = attrs.edge_lengths[(i, j)]
                     boundary_cost += 0.5 * l_ij / attrs.rho
 
             # Area cost (normalized by rho²)
@@ -206,19 +210,22 @@ class TestOptimality:
         )
         solver_energy = result.energy
 
-        # Brute-force: enumerate all 2^n partitions
-        min_energy = float("inf")
-        for bits in product([False, True], repeat=n):
-            partition = np.array(bits)
-            energy = compute_energy(
-                graph_data.attributes,
-                graph_data.edges,
-                partition,
-                lambda_param,
-                mu,
-            )
-            if energy < min_energy:
-                min_energy = energy
+        # Brute-force: enumerate all 2^n partitions as rows of a bool matrix
+        # and evaluate every energy at once
+        attrs = graph_data.attributes
+        bits = np.arange(1 << n)[:, None]
+        partitions = ((bits >> np.arange(n)) & 1).astype(bool)
+
+        # Edge (i, j) is cut when bits i and j of the partition index differ
+        edges = graph_data.edges
+        cuts = ((bits >> edges[:, 0]) ^ (bits >> edges[:, 1])) & 1
+        boundary_cost = lambda_param * (cuts @ attrs.edge_lengths) / attrs.rho
+        area_cost = (1 - lambda_param) * (partitions @ attrs.area) / attrs.rho**2
+        population_reward = mu * (partitions @ attrs.population)
+        energies = boundary_cost + area_cost - population_reward
+        # Row 0 is the empty partition, which has zero energy by definition
+        assert energies[0] == 0.0
+        min_energy = float(energies.min())
 
         # Solver should find the minimum
         assert solver_energy == pytest.approx(min_energy, rel=1e-9)
@@ -274,44 +281,30 @@ class TestDeterminism:
             assert results[0].selected_population == results[i].selected_population
             assert results[0].flow_value == results[i].flow_value
 
-    def test_determinism_across_lambda_values(self, simple_graph_data):
+    @pytest.mark.parametrize("lambda_param", [0.0, 0.3, 0.5, 0.7, 0.9])
+    def test_determinism_across_lambda_values(self, simple_graph_data, lambda_param):
         """Determinism holds for various lambda values."""
-        for lambda_param in [0.0, 0.3, 0.5, 0.7, 0.9]:
-            results = []
-            for _ in range(3):
-                result = solve_partition(
-                    simple_graph_data,
-                    lambda_param=lambda_param,
-                    mu=0.5,
-                    verbose=False,
-                )
-                results.append(result)
-
-            # All results for this lambda should be identical
-            for i in range(1, len(results)):
-                assert np.array_equal(results[0].partition, results[i].partition)
+        results = []
+        for _ in range(3):
+            result = solve_partition(
+                simple_graph_data,
+                lambda_param=lambda_param,
+                mu=0.5,
+                verbose=False,
+            )
+            results.append(result)
+
+        # All results for this lambda should be identical
+        for i in range(1, len(results)):
+            assert np.array_equal(results[0].partition, results[i].partition)
 
 
 class TestNumericalStability:
     """Tests for numerical edge cases."""
 
-    def test_tiny_populations(self):
+    def test_tiny_populations(self, simple_graph_data):
         """Handle very small populations (1 person per tract)."""
-        from half_america.graph.boundary import GraphAttributes
-        from half_america.graph.pipeline import GraphData
-
-        attributes = GraphAttributes(
-            population=np.array([1, 1, 1]),
-            area=np.array([1000.0, 1000.0, 1000.0]),
-            rho=100.0,
-            edge_lengths={(0, 1): 50.0, (1, 0): 50.0, (1, 2): 50.0, (2, 1): 50.0},
-        )
-        graph_data = GraphData(
-            edges=[(0, 1), (1, 2)],
-            attributes=attributes,
-            num_nodes=3,
-            num_edges=2,
-        )
+        graph_data = _with_population(simple_graph_data, np.full(3, 1))
 
         result = solve_partition(graph_data, lambda_param=0.5, mu=1000.0, verbose=False)
 
@@ -319,23 +312,9 @@ class TestNumericalStability:
         assert result.total_population == 3
         assert len(result.partition) == 3
 
-    def test_large_populations(self):
+    def test_large_populations(self, simple_graph_data):
         """Handle large populations (1 million per tract)."""
-        from half_america.graph.boundary import GraphAttributes
-        from half_america.graph.pipeline import GraphData
-
-        attributes = GraphAttributes(
-            population=np.array([1_000_000, 1_000_000, 1_000_000]),
-            area=np.array([1000.0, 1000.0, 1000.0]),
-            rho=100.0,
-            edge_lengths={(0, 1): 50.0, (1, 0): 50.0, (1, 2): 50.0, (2, 1): 50.0},
-        )
-        graph_data = GraphData(
-            edges=[(0, 1), (1, 2)],
-            attributes=attributes,
-            num_nodes=3,
-            num_edges=2,
-        )
+        graph_data = _with_population(simple_graph_data, np.full(3, 1_000_000))
 
         result = solve_partition(
             graph_data, lambda_param=0.5, mu=0.00001, verbose=False
@@ -1,7 +1,10 @@
 """Tests for binary search optimization."""
 
+import numpy as np
 import pytest
 
+from half_america.graph.boundary import GraphAttributes
+from half_america.graph.pipeline import GraphData
 from half_america.optimization import (
     DEFAULT_MAX_ITERATIONS,
     DEFAULT_MU_MIN,
@@ -61,6 +64,49 @@ class TestFindOptimalMu:
         assert result.iterations == 5
         assert not result.converged
 
+    def test_stops_when_bracket_collapses(self, complex_graph_data):
+        """Test early exit once no float64 μ is left inside the bracket."""
+        result = find_optimal_mu(
+            complex_graph_data,
+            lambda_param=0.5,
+            tolerance=1e-10,  # Impossible tolerance
+            max_iterations=200,
+            verbose=False,
+        )
+        assert not result.converged
+        assert result.iterations < 200
+        assert len(result.mu_history) == result.iterations
+
+    def test_resolves_jumps_finer_than_float32(self):
+        """Test that μ steps below float32 resolution can still be found.
+
+        Node 0 enters at μ=1 and node 1 at μ=1+6e-8, so only a μ inside that
+        gap selects node 0 alone. The gap is narrower than float32 epsilon,
+        but PyMaxflow's capacities are double precision and resolve it.
+        """
+        attributes = GraphAttributes(
+            population=np.array([1, 16_777_217, 1]),
+            area=np.array([1.0, 16_777_218.0, 1e12]),
+            rho=1.0,
+            edge_lengths=np.array([1.0, 1.0]),
+        )
+        graph_data = GraphData(
+            edges=np.array([(0, 1), (1, 2)]),
+            attributes=attributes,
+            num_nodes=3,
+            num_edges=2,
+        )
+        result = find_optimal_mu(
+            graph_data,
+            lambda_param=0.0,
+            target_fraction=1 / 16_777_219,
+            tolerance=1e-8,
+            mu_max=12.5,
+            verbose=False,
+        )
+        assert result.converged
+        assert result.result.selected_population == 1
+
     def test_custom_target_fraction(self, complex_graph_data):
         """Test with non-default target fraction.
 
@@ -126,6 +172,64 @@ class TestMonotonicity:
             assert has_increase or has_decrease
 
 
+class TestWarmStart:
+    """Tests for reusing one flow network across μ probes."""
+
+    def test_matches_cold_solves(self, tiny_graph_factory):
+        """Each warm-started probe matches a fresh solve at the same μ."""
+        graph_data = tiny_graph_factory(8)
+        search = find_optimal_mu(
+            graph_data,
+            lambda_param=0.3,
+            tolerance=0.001,
+            max_iterations=12,
+            verbose=False,
+        )
+        final = search.result
+        cold = solve_partition(graph_data, 0.3, search.mu_history[-1], verbose=False)
+
+        assert len(search.mu_history) > 1
+        assert (final.partition == cold.partition).all()
+        assert final.flow_value == pytest.approx(cold.flow_value)
+        assert final.energy == pytest.approx(cold.energy)
+
+
+class TestMuHint:
+    """Tests for starting the search from a μ hint."""
+
+    def test_good_hint_probed_first(self, complex_graph_data):
+        """A hint at the optimum is probed first and converges immediately."""
+        cold = find_optimal_mu(
+            complex_graph_data, lambda_param=0.5, tolerance=0.15, verbose=False
+        )
+        hinted = find_optimal_mu(
+            complex_graph_data,
+            lambda_param=0.5,
+            tolerance=0.15,  # Relaxed for small test graph
+            verbose=False,
+            mu_hint=cold.result.mu,
+        )
+        assert hinted.mu_history[0] == cold.result.mu
+        assert hinted.converged
+        assert hinted.iterations <= cold.iterations
+
+    @pytest.mark.parametrize("scale", [1e-4, 1e4])
+    def test_poor_hint_still_converges(self, complex_graph_data, scale):
+        """A hint far from the optimum still brackets and converges."""
+        cold = find_optimal_mu(
+            complex_graph_data, lambda_param=0.5, tolerance=0.15, verbose=False
+        )
+        hinted = find_optimal_mu(
+            complex_graph_data,
+            lambda_param=0.5,
+            tolerance=0.15,  # Relaxed for small test graph
+            mu_max=cold.result.mu * 1e5,
+            verbose=False,
+            mu_hint=cold.result.mu * scale,
+        )
+        assert hinted.converged
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
@@ -5,6 +5,7 @@ import pytest
 from half_america.optimization import (
     TARGET_TOLERANCE,
     OptimizationResult,
+    solve_network,
     solve_partition,
 )
 
@@ -43,7 +44,7 @@ class TestSolvePartition:
         )
         assert result.partition.all()
         assert result.selected_population == 600  # 100 + 200 + 300
-        assert result.population_fraction == pytest.approx(1.0)
+        assert result.population_fraction == 1.0
 
     def test_zero_mu_selects_none(self, simple_graph_data):
         """Test that zero mu selects no nodes."""
@@ -55,7 +56,7 @@ class TestSolvePartition:
         )
         assert not result.partition.any()
         assert result.selected_population == 0
-        assert result.population_fraction == pytest.approx(0.0)
+        assert result.population_fraction == 0.0
 
     def test_stores_parameters(self, simple_graph_data):
         """Test that parameters are stored in result."""
@@ -93,6 +94,25 @@ class TestSolvePartition:
         )
         assert result.flow_value >= 0
 
+    @pytest.mark.parametrize("mu", [0.0, 0.01, 1000.0])
+    def test_cut_derived_energy_matches_exact(self, simple_graph_data, mu):
+        """Test that energy from the cut value matches compute_energy."""
+        from half_america.graph.network import build_flow_network
+
+        results = [
+            solve_network(
+                simple_graph_data,
+                build_flow_network(
+                    simple_graph_data.attributes, simple_graph_data.edges, 0.5, mu
+                ),
+                lambda_param=0.5,
+                mu=mu,
+                exact_energy=exact,
+            )
+            for exact in (True, False)
+        ]
+        assert results[1].energy == pytest.approx(results[0].energy, abs=1e-6)
+
 
 class TestSolvePartitionValidation:
     """Tests for parameter validation."""
@@ -177,7 +197,7 @@ class TestSatisfiedTarget:
             mu=1000.0,
             verbose=False,
         )
-        assert result.population_fraction == pytest.approx(1.0)
+        assert result.selected_population == result.total_population
         assert result.satisfied_target is False
 
     def test_not_satisfied_at_0_percent(self, simple_graph_data):
@@ -188,7 +208,7 @@ class TestSatisfiedTarget:
             mu=0.0,
             verbose=False,
         )
-        assert result.population_fraction == pytest.approx(0.0)
+        assert result.selected_population == 0
         assert result.satisfied_target is False
 
     def test_target_tolerance_exported(self):
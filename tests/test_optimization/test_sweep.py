@@ -1,5 +1,6 @@
 """Tests for lambda parameter sweep."""
 
+import numpy as np
 import pytest
 
 from half_america.optimization import (
@@ -84,6 +85,42 @@ class TestSweepLambda:
         max_individual = max(r.elapsed_seconds for r in result.results.values())
         assert result.total_elapsed_seconds >= max_individual * 0.9  # Allow 10% margin
 
+    def test_reuses_initial_results(self, complex_graph_data):
+        """λ values present in initial_results are not re-solved."""
+        first = sweep_lambda(
+            complex_graph_data,
+            lambda_values=[0.0, 0.5],
+            tolerance=0.15,  # Relaxed for small test graph
+            verbose=False,
+        )
+        result = sweep_lambda(
+            complex_graph_data,
+            lambda_values=[0.0, 0.25, 0.5],
+            tolerance=0.15,
+            verbose=False,
+            initial_results=first.results,
+        )
+        assert result.lambda_values == [0.0, 0.25, 0.5]
+        assert result.results[0.0] is first.results[0.0]
+        assert result.results[0.5] is first.results[0.5]
+        assert 0.25 in result.results
+
+    def test_warm_start_seeds_from_previous_lambda(self, complex_graph_data):
+        """Sequential warm start probes the previous λ's μ first."""
+        result = sweep_lambda(
+            complex_graph_data,
+            lambda_values=[0.5, 0.0, 0.25],
+            tolerance=0.15,  # Relaxed for small test graph
+            verbose=False,
+            warm_start=True,
+        )
+        assert result.lambda_values == [0.5, 0.0, 0.25]
+        assert list(result.results) == [0.0, 0.25, 0.5]
+        assert result.all_converged
+        for prev, lam in [(0.0, 0.25), (0.25, 0.5)]:
+            first_probe = result.results[lam].search_result.mu_history[0]
+            assert first_probe == result.results[prev].search_result.result.mu
+
 
 class TestLambdaResult:
     """Tests for LambdaResult type."""
@@ -119,12 +156,15 @@ class TestLambdaResult:
 class TestParallelExecution:
     """Tests for parallel execution."""
 
-    def test_parallel_faster_than_sequential(self, complex_graph_data):
+    def test_parallel_faster_than_sequential(self, tiny_graph_factory):
         """Parallel execution should not be slower than sequential."""
+        # A longer chain keeps solve time well above thread start-up cost
+        graph_data = tiny_graph_factory(5000)
+
         # Use λ values that converge well on small graphs
         # Run with 1 worker (sequential)
         sequential = sweep_lambda(
-            complex_graph_data,
+            graph_data,
             lambda_values=[0.0, 0.25, 0.5],
             tolerance=0.15,  # Relaxed for small test graph
             max_workers=1,
@@ -133,7 +173,7 @@ class TestParallelExecution:
 
         # Run with multiple workers (parallel)
         parallel = sweep_lambda(
-            complex_graph_data,
+            graph_data,
             lambda_values=[0.0, 0.25, 0.5],
             tolerance=0.15,  # Relaxed for small test graph
             max_workers=3,
@@ -144,6 +184,22 @@ class TestParallelExecution:
         # (may not be faster for small test graph due to overhead)
         assert parallel.total_elapsed_seconds <= sequential.total_elapsed_seconds * 1.5
 
+    def test_process_backend_matches_threads(self, complex_graph_data):
+        """Process workers produce the same results as threads."""
+        kwargs = dict(lambda_values=[0.0, 0.5], tolerance=0.15, verbose=False)
+        threaded = sweep_lambda(complex_graph_data, max_workers=2, **kwargs)
+        processes = sweep_lambda(
+            complex_graph_data, max_workers=2, backend="process", **kwargs
+        )
+
+        for lam in (0.0, 0.5):
+            expected = threaded.results[lam].search_result
+            actual = processes.results[lam].search_result
+            assert actual.mu_history == expected.mu_history
+            np.testing.assert_array_equal(
+                actual.result.partition, expected.result.partition
+            )
+
 
 class TestEarlyTermination:
     """Tests for early termination on convergence failure."""
@@ -181,15 +237,42 @@ class TestSweepPersistence:
             verbose=False,
         )
 
-        path = tmp_path / "test_sweep.pkl"
+        path = tmp_path / "test_sweep.feather"
         save_sweep_result(result, path)
         loaded = load_sweep_result(path)
 
         assert loaded.lambda_values == result.lambda_values
         assert loaded.total_iterations == result.total_iterations
         assert loaded.all_converged == result.all_converged
+        assert loaded.target_fraction == result.target_fraction
+        assert loaded.tolerance == 0.15
+        assert loaded.graph_fingerprint == result.graph_fingerprint is not None
         assert set(loaded.results.keys()) == set(result.results.keys())
 
+    def test_roundtrip_preserves_partitions(self, complex_graph_data, tmp_path):
+        """Partitions and per-λ statistics survive the roundtrip."""
+        result = sweep_lambda(
+            complex_graph_data,
+            lambda_values=[0.0, 0.5],
+            tolerance=0.15,
+            verbose=False,
+        )
+
+        path = tmp_path / "test_sweep.feather"
+        save_sweep_result(result, path)
+        loaded = load_sweep_result(path)
+
+        for lam, lambda_result in result.results.items():
+            expected = lambda_result.search_result
+            actual = loaded.results[lam].search_result
+            assert np.array_equal(actual.result.partition, expected.result.partition)
+            assert actual.result.partition.dtype == bool
+            assert actual.result == expected.result._replace(
+                partition=actual.result.partition
+            )
+            assert actual.mu_history == expected.mu_history
+            assert actual.iterations == expected.iterations
+
     def test_save_creates_parent_dirs(self, complex_graph_data, tmp_path):
         """Save creates parent directories if needed."""
         result = sweep_lambda(
@@ -199,14 +282,14 @@ class TestSweepPersistence:
             verbose=False,
         )
 
-        path = tmp_path / "nested" / "dirs" / "test.pkl"
+        path = tmp_path / "nested" / "dirs" / "test.feather"
         save_sweep_result(result, path)
         assert path.exists()
 
     def test_load_nonexistent_raises(self, tmp_path):
         """Load raises FileNotFoundError for missing file."""
         with pytest.raises(FileNotFoundError):
-            load_sweep_result(tmp_path / "nonexistent.pkl")
+            load_sweep_result(tmp_path / "nonexistent.feather")
 
 
 class TestSweepCachePath:
@@ -228,9 +311,9 @@ class TestSweepCachePath:
         path = get_sweep_cache_path(0.05)
         assert "0.05" in path.name
 
-    def test_cache_path_is_pkl(self):
-        """Cache path has .pkl extension."""
+    def test_cache_path_is_feather(self):
+        """Cache path has .feather extension."""
         from half_america.data.cache import get_sweep_cache_path
 
         path = get_sweep_cache_path()
-        assert path.suffix == ".pkl"
+        assert path.suffix == ".feather"
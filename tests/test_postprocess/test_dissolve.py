@@ -1,9 +1,18 @@
 """Tests for dissolve module."""
 
+import geopandas as gpd
 import numpy as np
 import pytest
+import shapely
+from shapely import box
 
-from half_america.postprocess.dissolve import DissolveResult, dissolve_partition
+from half_america.graph.pipeline import load_graph_data
+from half_america.optimization import sweep_lambda
+from half_america.postprocess.dissolve import (
+    DissolveResult,
+    dissolve_all_lambdas,
+    dissolve_partition,
+)
 
 
 class TestDissolvePartition:
@@ -60,6 +69,26 @@ class TestDissolvePartition:
         result = dissolve_partition(grid_4x4_gdf, contiguous_partition)
         assert result.total_area_sqm == pytest.approx(selected_area, rel=0.001)
 
+    def test_matches_overlay_union(self, grid_4x4_gdf, checkerboard_partition):
+        """Coverage union should match a full overlay union."""
+        result = dissolve_partition(grid_4x4_gdf, checkerboard_partition)
+        expected = grid_4x4_gdf[checkerboard_partition].geometry.union_all()
+        assert result.geometry.equals(expected)
+
+    def test_non_coverage_falls_back_to_union(self):
+        """Incorrectly noded input (a T-junction) should fall back to union_all."""
+        # The right tract's left edge spans both left tracts without a vertex
+        # at (1, 1), which coverage union rejects
+        gdf = gpd.GeoDataFrame(
+            geometry=[box(0, 0, 1, 1), box(0, 1, 1, 2), box(1, 0, 2, 2)],
+            crs="EPSG:5070",
+        )
+        result = dissolve_partition(gdf, np.ones(3, dtype=bool))
+
+        assert result.geometry.is_valid
+        assert result.num_parts == 1
+        assert result.geometry.equals(box(0, 0, 2, 2))
+
 
 class TestDissolvePartitionErrors:
     """Tests for error handling in dissolve_partition."""
@@ -93,35 +122,49 @@ class TestDissolveWithIsland:
         assert result.num_tracts == 2
 
 
+@pytest.fixture(scope="module")
+def mini_sweep_result(grid_4x4_gdf):
+    """Run a two-λ sweep on the 4x4 grid once for the whole module.
+
+    Note: Small 4x4 grids exhibit phase transitions at high λ values,
+    so we use only λ=0.0 and λ=0.1 which allow partial selection.
+    """
+    # Build graph from test data (not cache) and run mini sweep
+    graph_data = load_graph_data(grid_4x4_gdf, use_cache=False, verbose=False)
+    return sweep_lambda(
+        graph_data,
+        lambda_values=[0.0, 0.1],  # Low λ values that work with small grids
+        tolerance=0.20,  # 20% tolerance for small 4x4 discrete grid
+        verbose=False,
+    )
+
+
 class TestDissolveAllLambdas:
     """Tests for dissolve_all_lambdas batch function."""
 
-    def test_processes_all_lambda_values(self, grid_4x4_gdf):
-        """Should process all lambda values from sweep result.
-
-        Note: Small 4x4 grids exhibit phase transitions at high λ values,
-        so we use only λ=0.0 and λ=0.1 which allow partial selection.
-        """
-        from half_america.graph.pipeline import load_graph_data
-        from half_america.optimization import sweep_lambda
-        from half_america.postprocess.dissolve import dissolve_all_lambdas
-
-        # Build graph from test data (not cache) and run mini sweep
-        graph_data = load_graph_data(grid_4x4_gdf, use_cache=False, verbose=False)
-        sweep_result = sweep_lambda(
-            graph_data,
-            lambda_values=[0.0, 0.1],  # Low λ values that work with small grids
-            tolerance=0.20,  # 20% tolerance for small 4x4 discrete grid
-            verbose=False,
-        )
-
-        results = dissolve_all_lambdas(grid_4x4_gdf, sweep_result, verbose=False)
+    def test_processes_all_lambda_values(self, grid_4x4_gdf, mini_sweep_result):
+        """Should process all lambda values from sweep result."""
+        results = dissolve_all_lambdas(grid_4x4_gdf, mini_sweep_result, verbose=False)
 
         assert len(results) == 2
         assert 0.0 in results
         assert 0.1 in results
 
-        for lambda_val, result in results.items():
+        for result in results.values():
             assert isinstance(result, DissolveResult)
-            assert result.geometry.is_valid
             assert result.num_tracts > 0
+        assert shapely.is_valid([r.geometry for r in results.values()]).all()
+
+    def test_parallel_matches_sequential(self, grid_4x4_gdf, mini_sweep_result):
+        """Dissolving λ values in threads gives the same geometries."""
+        sequential = dissolve_all_lambdas(
+            grid_4x4_gdf, mini_sweep_result, verbose=False
+        )
+        parallel = dissolve_all_lambdas(
+            grid_4x4_gdf, mini_sweep_result, verbose=False, max_workers=2
+        )
+
+        assert list(parallel) == list(sequential)
+        for lambda_val, result in parallel.items():
+            assert shapely.equals(result.geometry, sequential[lambda_val].geometry)
+            assert result.num_tracts == sequential[lambda_val].num_tracts
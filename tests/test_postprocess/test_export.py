@@ -1,7 +1,8 @@
 """Tests for export module."""
 
 import json
-from unittest.mock import MagicMock
+from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 from shapely import MultiPolygon, Polygon
@@ -13,6 +14,7 @@ from half_america.postprocess.export import (
     ExportResult,
     export_all_lambdas,
     export_combined_topojson,
+    export_lambda,
     export_to_topojson,
 )
 from half_america.postprocess.simplify import SimplifyResult
@@ -21,9 +23,9 @@ from half_america.postprocess.simplify import SimplifyResult
 class TestExportToTopojson:
     """Tests for export_to_topojson function."""
 
-    def test_returns_export_result(self, simple_polygon, tmp_path, sample_metadata):
+    def test_returns_export_result(self, simple_polygon, output_dir, sample_metadata):
         """Should return an ExportResult with all fields."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         result = export_to_topojson(simple_polygon, output_path, sample_metadata)
 
         assert isinstance(result, ExportResult)
@@ -32,39 +34,36 @@ class TestExportToTopojson:
         assert result.lambda_value == sample_metadata.lambda_value
         assert result.object_name == "selected_region"
 
-    def test_creates_valid_topojson(self, simple_polygon, tmp_path, sample_metadata):
+    def test_creates_valid_topojson(self, simple_polygon, output_dir, sample_metadata):
         """Output should be valid TopoJSON."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         export_to_topojson(simple_polygon, output_path, sample_metadata)
 
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         assert data["type"] == "Topology"
         assert "objects" in data
         assert "arcs" in data
 
     def test_includes_metadata_properties(
-        self, simple_polygon, tmp_path, sample_metadata
+        self, simple_polygon, output_dir, sample_metadata
     ):
         """TopoJSON should include metadata as properties."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         export_to_topojson(simple_polygon, output_path, sample_metadata)
 
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         # Properties are in the geometry object
         obj = data["objects"]["selected_region"]
         assert "properties" in obj or "geometries" in obj
 
-    def test_transforms_to_wgs84(self, simple_polygon, tmp_path, sample_metadata):
+    def test_transforms_to_wgs84(self, simple_polygon, output_dir, sample_metadata):
         """Coordinates should be in WGS84 (longitude/latitude range)."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         export_to_topojson(simple_polygon, output_path, sample_metadata)
 
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         # Check transform or bbox is in reasonable WGS84 range
         if "bbox" in data:
@@ -73,50 +72,74 @@ class TestExportToTopojson:
             assert -180 <= bbox[0] <= 180
             assert -90 <= bbox[1] <= 90
 
-    def test_empty_geometry_raises(self, tmp_path, sample_metadata):
+    def test_empty_geometry_raises(self, output_dir, sample_metadata):
         """Empty geometry should raise ValueError."""
         empty = Polygon()
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
 
         with pytest.raises(ValueError, match="empty geometry"):
             export_to_topojson(empty, output_path, sample_metadata)
 
     def test_multipolygon_input(
-        self, disconnected_multipolygon, tmp_path, sample_metadata
+        self, disconnected_multipolygon, output_dir, sample_metadata
     ):
         """Should handle MultiPolygon input correctly."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         result = export_to_topojson(
             disconnected_multipolygon, output_path, sample_metadata
         )
 
         assert result.file_size_bytes > 0
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
         assert data["type"] == "Topology"
 
-    def test_custom_object_name(self, simple_polygon, tmp_path, sample_metadata):
+    def test_custom_object_name(self, simple_polygon, output_dir, sample_metadata):
         """Should use custom object name."""
-        output_path = tmp_path / "test.json"
+        output_path = output_dir / "test.json"
         export_to_topojson(
             simple_polygon, output_path, sample_metadata, object_name="custom_region"
         )
 
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         assert "custom_region" in data["objects"]
 
     def test_creates_parent_directories(
-        self, simple_polygon, tmp_path, sample_metadata
+        self, simple_polygon, output_dir, sample_metadata
     ):
         """Should create parent directories if they don't exist."""
-        output_path = tmp_path / "nested" / "dir" / "test.json"
+        output_path = output_dir / "nested" / "dir" / "test.json"
         export_to_topojson(simple_polygon, output_path, sample_metadata)
 
         assert output_path.exists()
 
 
+class TestExportLambda:
+    """Tests for export_lambda single-lambda function."""
+
+    def test_exports_single_lambda(
+        self,
+        sample_simplify_results,
+        sample_dissolve_results,
+        sample_sweep_result,
+        output_dir,
+    ):
+        """Should write lambda_X.XX.json with dissolve metadata."""
+        result = export_lambda(
+            0.5,
+            sample_simplify_results[0.5],
+            sample_dissolve_results[0.5],
+            sample_sweep_result,
+            output_dir=output_dir,
+        )
+
+        assert result.path == output_dir / "lambda_0.50.json"
+        assert result.lambda_value == 0.5
+        data = json.loads(result.path.read_bytes())
+        props = data["objects"]["selected_region"]["geometries"][0]["properties"]
+        assert props["num_parts"] == sample_dissolve_results[0.5].num_parts
+
+
 class TestExportAllLambdas:
     """Tests for export_all_lambdas batch function."""
 
@@ -125,14 +148,14 @@ class TestExportAllLambdas:
         sample_simplify_results,
         sample_dissolve_results,
         sample_sweep_result,
-        tmp_path,
+        output_dir,
     ):
         """Should export all lambda values."""
         results = export_all_lambdas(
             sample_simplify_results,
             sample_dissolve_results,
             sample_sweep_result,
-            output_dir=tmp_path,
+            output_dir=output_dir,
             verbose=False,
         )
 
@@ -146,19 +169,19 @@ class TestExportAllLambdas:
         sample_simplify_results,
         sample_dissolve_results,
         sample_sweep_result,
-        tmp_path,
+        output_dir,
     ):
         """Should create files with lambda_X.XX.json naming."""
         export_all_lambdas(
             sample_simplify_results,
             sample_dissolve_results,
             sample_sweep_result,
-            output_dir=tmp_path,
+            output_dir=output_dir,
             verbose=False,
         )
 
         for lambda_val in sample_simplify_results:
-            expected_path = tmp_path / f"lambda_{lambda_val:.2f}.json"
+            expected_path = output_dir / f"lambda_{lambda_val:.2f}.json"
             assert expected_path.exists()
 
 
@@ -170,10 +193,10 @@ class TestExportCombinedTopojson:
         sample_simplify_results,
         sample_dissolve_results,
         sample_sweep_result,
-        tmp_path,
+        output_dir,
     ):
         """Should create a single combined file."""
-        output_path = tmp_path / "combined.json"
+        output_path = output_dir / "combined.json"
         result = export_combined_topojson(
             sample_simplify_results,
             sample_dissolve_results,
@@ -190,10 +213,10 @@ class TestExportCombinedTopojson:
         sample_simplify_results,
         sample_dissolve_results,
         sample_sweep_result,
-        tmp_path,
+        output_dir,
     ):
         """Combined file should contain all lambda objects."""
-        output_path = tmp_path / "combined.json"
+        output_path = output_dir / "combined.json"
         export_combined_topojson(
             sample_simplify_results,
             sample_dissolve_results,
@@ -202,8 +225,7 @@ class TestExportCombinedTopojson:
             verbose=False,
         )
 
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         assert data["type"] == "Topology"
         for lambda_val in sample_simplify_results:
@@ -213,14 +235,29 @@ class TestExportCombinedTopojson:
 # Fixtures specific to export tests
 
 
+@pytest.fixture(scope="session")
+def export_tmpdir(tmp_path_factory) -> Path:
+    """Create one temporary directory shared by all export tests."""
+    return tmp_path_factory.mktemp("export")
+
+
 @pytest.fixture
+def output_dir(export_tmpdir, request) -> Path:
+    """Return a per-test path inside the shared export directory.
+
+    The directory itself is created by the exporters on first write.
+    """
+    return export_tmpdir / request.node.name
+
+
+@pytest.fixture(scope="session")
 def simple_polygon() -> Polygon:
     """Create a simple polygon in EPSG:5070 coordinates."""
     # Coordinates roughly in center of CONUS (Kansas area)
     return box(-500000, 1500000, 500000, 2500000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def disconnected_multipolygon() -> MultiPolygon:
     """Create two disconnected polygons."""
     poly1 = box(-500000, 1500000, 0, 2000000)
@@ -228,7 +265,7 @@ def disconnected_multipolygon() -> MultiPolygon:
     return MultiPolygon([poly1, poly2])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata() -> ExportMetadata:
     """Create sample metadata for testing."""
     return ExportMetadata(
@@ -241,86 +278,60 @@ def sample_metadata() -> ExportMetadata:
     )
 
 
-@pytest.fixture
+# λ values and dissolved part counts shared by the sample result fixtures
+SAMPLE_NUM_PARTS = {0.0: 100, 0.5: 50, 0.9: 10}
+SAMPLE_GEOMETRY = box(-500000, 1500000, 500000, 2500000)
+
+
+@pytest.fixture(scope="session")
 def sample_simplify_results() -> dict[float, SimplifyResult]:
     """Create sample simplify results for testing."""
-    geom = box(-500000, 1500000, 500000, 2500000)
     return {
-        0.0: SimplifyResult(
-            geometry=geom,
+        lambda_val: SimplifyResult(
+            geometry=SAMPLE_GEOMETRY,
             original_vertex_count=100,
             simplified_vertex_count=10,
             reduction_percent=90.0,
-        ),
-        0.5: SimplifyResult(
-            geometry=geom,
-            original_vertex_count=100,
-            simplified_vertex_count=10,
-            reduction_percent=90.0,
-        ),
-        0.9: SimplifyResult(
-            geometry=geom,
-            original_vertex_count=100,
-            simplified_vertex_count=10,
-            reduction_percent=90.0,
-        ),
+        )
+        for lambda_val in SAMPLE_NUM_PARTS
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dissolve_results() -> dict[float, DissolveResult]:
     """Create sample dissolve results for testing."""
-    geom = box(-500000, 1500000, 500000, 2500000)
     return {
-        0.0: DissolveResult(
-            geometry=geom,
-            num_parts=100,
-            total_area_sqm=geom.area,
+        lambda_val: DissolveResult(
+            geometry=SAMPLE_GEOMETRY,
+            num_parts=num_parts,
+            total_area_sqm=SAMPLE_GEOMETRY.area,
             num_tracts=30000,
             population_selected=165_000_000,
             total_population=328_912_183,
-        ),
-        0.5: DissolveResult(
-            geometry=geom,
-            num_parts=50,
-            total_area_sqm=geom.area,
-            num_tracts=30000,
-            population_selected=165_000_000,
-            total_population=328_912_183,
-        ),
-        0.9: DissolveResult(
-            geometry=geom,
-            num_parts=10,
-            total_area_sqm=geom.area,
-            num_tracts=30000,
-            population_selected=165_000_000,
-            total_population=328_912_183,
-        ),
+        )
+        for lambda_val, num_parts in SAMPLE_NUM_PARTS.items()
     }
 
 
-@pytest.fixture
-def sample_sweep_result():
-    """Create a mock SweepResult for testing export functions."""
-    total_area = 7_910_000_000_000_000.0  # ~7.9 trillion sq m
+class _OptimizationStub(NamedTuple):
+    total_area: float
 
-    def make_lambda_result(lambda_val: float):
-        """Create a mock LambdaResult with nested structure."""
-        mock_opt_result = MagicMock()
-        mock_opt_result.total_area = total_area
 
-        mock_search_result = MagicMock()
-        mock_search_result.result = mock_opt_result
+class _SearchStub(NamedTuple):
+    result: _OptimizationStub
 
-        mock_lambda_result = MagicMock()
-        mock_lambda_result.search_result = mock_search_result
 
-        return mock_lambda_result
+class _LambdaStub(NamedTuple):
+    search_result: _SearchStub
 
-    mock_sweep = MagicMock()
-    mock_sweep.results = {
-        0.0: make_lambda_result(0.0),
-        0.5: make_lambda_result(0.5),
-        0.9: make_lambda_result(0.9),
-    }
-    return mock_sweep
+
+class _SweepStub(NamedTuple):
+    results: dict[float, _LambdaStub]
+
+
+@pytest.fixture(scope="session")
+def sample_sweep_result() -> _SweepStub:
+    """Create a stand-in SweepResult carrying only what export reads."""
+    total_area = 7_910_000_000_000_000.0  # ~7.9 trillion sq m
+    lambda_result = _LambdaStub(_SearchStub(_OptimizationStub(total_area)))
+    return _SweepStub({lambda_val: lambda_result for lambda_val in SAMPLE_NUM_PARTS})
@@ -1,6 +1,8 @@
 """Tests for simplify module."""
 
+import numpy as np
 import pytest
+import shapely
 from shapely import MultiPolygon, Polygon
 from shapely.geometry import box
 
@@ -101,8 +103,26 @@ class TestSimplifyAllLambdas:
         """All simplified geometries should be valid."""
         results = simplify_all_lambdas(sample_dissolve_results, verbose=False)
 
-        for result in results.values():
-            assert result.geometry.is_valid
+        assert shapely.is_valid([r.geometry for r in results.values()]).all()
+
+    def test_vertex_counts_match_geometries(self, sample_dissolve_results):
+        """Reported vertex counts should match the input and output geometries."""
+        results = simplify_all_lambdas(sample_dissolve_results, verbose=False)
+        lambdas = list(sample_dissolve_results)
+
+        original = shapely.get_num_coordinates(
+            [sample_dissolve_results[lam].geometry for lam in lambdas]
+        )
+        simplified = shapely.get_num_coordinates(
+            [results[lam].geometry for lam in lambdas]
+        )
+
+        np.testing.assert_array_equal(
+            original, [results[lam].original_vertex_count for lam in lambdas]
+        )
+        np.testing.assert_array_equal(
+            simplified, [results[lam].simplified_vertex_count for lam in lambdas]
+        )
 
     def test_custom_tolerance(self, sample_dissolve_results):
         """Should apply custom tolerance to all geometries."""
@@ -123,37 +143,34 @@ class TestSimplifyAllLambdas:
 # Fixtures specific to simplify tests
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_square() -> Polygon:
     """Create a simple square polygon."""
     return box(0, 0, 1000, 1000)
 
 
-@pytest.fixture
+def _zigzag_edge(n: int) -> np.ndarray:
+    """Top-edge vertices (i * 100, y) with y alternating 1050 and 1000."""
+    i = np.arange(n)
+    return np.column_stack([i * 100, 1000 + 50 * (i % 2 == 0)])
+
+
+@pytest.fixture(scope="session")
 def complex_polygon() -> Polygon:
     """Create a polygon with many vertices for simplification testing.
 
     Creates a jagged polygon with 40+ vertices that can be meaningfully simplified.
     """
-    coords = [(0, 0)]
-    # Create jagged edge along top
-    for i in range(20):
-        x = i * 100
-        y = 1000 + (50 if i % 2 == 0 else 0)  # Zigzag
-        coords.append((x, y))
-    coords.append((2000, 1000))
-    # Create jagged edge along right
-    for i in range(10):
-        x = 2000 + (50 if i % 2 == 0 else 0)
-        y = 1000 - i * 100
-        coords.append((x, y))
-    coords.append((2000, 0))
-    coords.append((0, 0))  # Close
+    # Jagged edges along the top and right
+    top = _zigzag_edge(20)
+    i = np.arange(10)
+    right = np.column_stack([2000 + 50 * (i % 2 == 0), 1000 - i * 100])
+    coords = np.vstack([[(0, 0)], top, [(2000, 1000)], right, [(2000, 0), (0, 0)]])
 
     return Polygon(coords)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def disconnected_multipolygon() -> MultiPolygon:
     """Create two disconnected squares."""
     square1 = box(0, 0, 1000, 1000)
@@ -161,16 +178,11 @@ def disconnected_multipolygon() -> MultiPolygon:
     return MultiPolygon([square1, square2])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dissolve_results() -> dict[float, DissolveResult]:
     """Create sample dissolve results for testing simplify_all_lambdas."""
     # Create a simple complex geometry
-    coords = [(0, 0)]
-    for i in range(20):
-        coords.append((i * 100, 1000 + (50 if i % 2 == 0 else 0)))
-    coords.append((2000, 1000))
-    coords.append((2000, 0))
-    coords.append((0, 0))
+    coords = np.vstack([[(0, 0)], _zigzag_edge(20), [(2000, 1000), (2000, 0), (0, 0)]])
     geom = Polygon(coords)
 
     return {
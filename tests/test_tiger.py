@@ -0,0 +1,28 @@
+"""Tests for TIGER/Line download helpers."""
+
+import pyogrio
+
+from half_america.data import tiger
+
+
+class TestGdalHttpOptions:
+    def test_applied_only_while_reading(self, monkeypatch):
+        """Test that GDAL options are set inside the read and cleared after."""
+        for key in tiger.GDAL_HTTP_OPTIONS:
+            monkeypatch.delenv(key, raising=False)
+
+        with tiger._gdal_http_options():
+            with tiger._gdal_http_options():  # Concurrent readers nest
+                pass
+            assert pyogrio.get_gdal_config_option("GDAL_HTTP_MULTIPLEX") == "YES"
+
+        for key in tiger.GDAL_HTTP_OPTIONS:
+            assert pyogrio.get_gdal_config_option(key) is None
+
+    def test_keeps_user_setting(self, monkeypatch):
+        """Test that options already set in the environment are not overridden."""
+        monkeypatch.setenv("GDAL_HTTP_MULTIPLEX", "NO")
+
+        with tiger._gdal_http_options():
+            assert pyogrio.get_gdal_config_option("GDAL_HTTP_MULTIPLEX") == "NO"
+        assert pyogrio.get_gdal_config_option("GDAL_HTTP_MULTIPLEX") == "NO"